@@ -12,9 +12,16 @@ import logging
 
 from backend.core.dependencies import db_dependency, get_current_active_user
 from backend.models.user import User
-from backend.schemas.token import Token, AccessToken, RefreshTokenRequest
+from backend.schemas.token import (
+    ACCESS_TOKEN_ADAPTER,
+    TOKEN_ADAPTER,
+    Token,
+    AccessToken,
+    RefreshTokenRequest,
+)
 from backend.schemas.user import UserResponse
 from backend.services.auth_service import AuthService
+from backend.utils.responses import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +47,9 @@ def login(
     """
     logger.info("Login requested for username=%s", form_data.username)
     service = AuthService(conn)
-    return service.login(form_data.username, form_data.password)
+    return json_response(
+        TOKEN_ADAPTER, service.login(form_data.username, form_data.password)
+    )
 
 
 @router.post(
@@ -57,7 +66,7 @@ def refresh_token(
     """
     logger.info("Refreshing access token")
     service = AuthService(conn)
-    return service.refresh(body.refresh_token)
+    return json_response(ACCESS_TOKEN_ADAPTER, service.refresh(body.refresh_token))
 
 
 @router.post(
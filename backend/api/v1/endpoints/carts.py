@@ -4,6 +4,7 @@ Cart management endpoints (any authenticated user can access):
   GET    /carts                          – List carts with desk_number
   PATCH  /carts/{cart_id}                – Update cart (e.g., desk_number)
   GET    /carts/{cart_id}                – Get cart summary (items + totals)
+  GET    /carts/{cart_id}/totals         – Get cart totals only
   POST   /carts/{cart_id}/complete       – Mark cart as completed
   POST   /carts/{cart_id}/delete         – Mark cart as deleted
   POST   /carts/{cart_id}/items          – Add item to cart
@@ -21,18 +22,22 @@ import logging
 from backend.core.dependencies import db_dependency, get_current_active_user
 from backend.models.user import User
 from backend.schemas.cart import (
+    CART_LIST_ENTRY_LIST,
     CartCreate,
     CartUpdate,
     CartItemCreate,
     CartItemReturn,
     CartItemUpdate,
     CartItemResponse,
+    CartListEntryResponse,
     CartResponse,
     CartSummaryResponse,
     CartStatus,
+    CartTotals,
 )
 from backend.services.cart_service import CartService
 from backend.services.pdf_service import PDFService
+from backend.utils.responses import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -58,17 +63,23 @@ def create_cart(
 
 @router.get(
     "",
-    response_model=list[CartResponse],
+    response_model=list[CartListEntryResponse],
     summary="List carts with desk_number",
 )
 def list_carts_with_desk_number(
     conn=Depends(db_dependency),
     _: User = Depends(get_current_active_user),
 ):
-    """Return all carts that have a desk_number assigned."""
+    """Return all carts that have a desk_number assigned, with item counts and totals."""
     logger.info("Listing carts with desk_number")
     service = CartService(conn)
-    return service.list_carts_with_desk_number()
+    return json_response(
+        CART_LIST_ENTRY_LIST,
+        [
+            CartListEntryResponse.from_model(cart, item_count, total)
+            for cart, item_count, total in service.list_carts_with_desk_number()
+        ],
+    )
 
 
 @router.get(
@@ -87,6 +98,22 @@ def get_cart_summary(
     return service.calculate_totals(cart_id)
 
 
+@router.get(
+    "/{cart_id}/totals",
+    response_model=CartTotals,
+    summary="Get cart totals without line items",
+)
+def get_cart_totals(
+    cart_id: int,
+    conn=Depends(db_dependency),
+    _: User = Depends(get_current_active_user),
+):
+    """Return only the pricing totals for a cart."""
+    logger.info("Fetching cart totals cart_id=%s", cart_id)
+    service = CartService(conn)
+    return service.calculate_totals_only(cart_id)
+
+
 @router.patch(
     "/{cart_id}",
     response_model=CartResponse,
@@ -11,8 +11,14 @@ import logging
 
 from backend.core.dependencies import db_dependency, get_current_active_user
 from backend.models.user import User
-from backend.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse
+from backend.schemas.category import (
+    CATEGORY_RESPONSE_LIST,
+    CategoryCreate,
+    CategoryUpdate,
+    CategoryResponse,
+)
 from backend.services.category_service import CategoryService
+from backend.utils.responses import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +57,10 @@ def list_categories(
     """Return a list of all categories, sorted by name."""
     logger.info("Listing categories")
     service = CategoryService(conn)
-    return service.list_categories()
+    return json_response(
+        CATEGORY_RESPONSE_LIST,
+        [CategoryResponse.from_model(category) for category in service.list_categories()],
+    )
 
 
 @router.get(
@@ -23,6 +23,10 @@ from backend.core.dependencies import (
 )
 from backend.models.user import User
 from backend.schemas.daily_account import (
+    CATEGORY_SALES_LIST,
+    DAILY_ACCOUNT_RESPONSE_LIST,
+    DAILY_ACCOUNT_SUMMARY,
+    TOP_SELLER_LIST,
     DailyAccountResponse,
     DailyAccountSummaryResponse,
     ItemSalesResponse,
@@ -30,6 +34,7 @@ from backend.schemas.daily_account import (
     CategorySalesResponse,
 )
 from backend.services.daily_account_service import DailyAccountService
+from backend.utils.responses import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +74,11 @@ def list_accounts(
     """Return a list of recent daily accounts, sorted by date descending."""
     logger.info("Listing daily accounts limit=%s", limit)
     service = DailyAccountService(conn)
-    return service.list_accounts(limit=limit)
+    accounts = service.list_accounts(limit=limit)
+    return json_response(
+        DAILY_ACCOUNT_RESPONSE_LIST,
+        [DailyAccountResponse.from_model(account) for account in accounts],
+    )
 
 
 @router.get(
@@ -85,9 +94,8 @@ def get_account_by_date(
     """Return a daily account summary for a specific date."""
     logger.info("Fetching daily account by date=%s", account_date)
     service = DailyAccountService(conn)
-    return service.get_summary(
-        service.get_account_by_date(account_date).id
-    )
+    summary = service.get_summary(service.get_account_by_date(account_date).id)
+    return json_response(DAILY_ACCOUNT_SUMMARY, summary)
 
 
 @router.get(
@@ -103,7 +111,7 @@ def get_account(
     """Return a daily account with all items and totals."""
     logger.info("Fetching daily account id=%s", account_id)
     service = DailyAccountService(conn)
-    return service.get_summary(account_id)
+    return json_response(DAILY_ACCOUNT_SUMMARY, service.get_summary(account_id))
 
 
 # -----------------------------------------------------------------------------
@@ -210,7 +218,10 @@ def get_top_sellers(
     """
     logger.info("Fetching top sellers start_date=%s end_date=%s", start_date, end_date)
     service = DailyAccountService(conn)
-    return service.get_top_sellers(start_date, end_date, limit)
+    rows = service.get_top_sellers(start_date, end_date, limit)
+    return json_response(
+        TOP_SELLER_LIST, [TopSellerResponse.model_construct(**row) for row in rows]
+    )
 
 
 @router.get(
@@ -229,7 +240,11 @@ def get_sales_by_category(
     """
     logger.info("Fetching sales by category start_date=%s end_date=%s", start_date, end_date)
     service = DailyAccountService(conn)
-    return service.get_sales_by_category(start_date, end_date)
+    rows = service.get_sales_by_category(start_date, end_date)
+    return json_response(
+        CATEGORY_SALES_LIST,
+        [CategorySalesResponse.model_construct(**row) for row in rows],
+    )
 
 
 @router.get(
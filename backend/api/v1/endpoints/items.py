@@ -13,8 +13,9 @@ import logging
 
 from backend.core.dependencies import db_dependency, get_current_active_user
 from backend.models.user import User
-from backend.schemas.item import ItemCreate, ItemUpdate, ItemResponse
+from backend.schemas.item import ITEM_RESPONSE_LIST, ItemCreate, ItemUpdate, ItemResponse
 from backend.services.item_service import ItemService
+from backend.utils.responses import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +58,10 @@ def list_items(
     """
     logger.info("Listing items category_id=%s", category_id)
     service = ItemService(conn)
-    return service.list_items(category_id=category_id)
+    items = service.list_items(category_id=category_id)
+    return json_response(
+        ITEM_RESPONSE_LIST, [ItemResponse.from_model(item) for item in items]
+    )
 
 
 @router.get(
@@ -73,7 +77,10 @@ def search_items(
     """Search items by name (case-insensitive partial match)."""
     logger.info("Searching items query=%s", q)
     service = ItemService(conn)
-    return service.search_items(q)
+    items = service.search_items(q)
+    return json_response(
+        ITEM_RESPONSE_LIST, [ItemResponse.from_model(item) for item in items]
+    )
 
 
 @router.get(
@@ -11,12 +11,15 @@ import logging
 from backend.core.dependencies import db_dependency, get_current_active_user
 from backend.models.user import User
 from backend.schemas.menu import (
+    MENU_CATEGORY_GROUP_PUBLIC_LIST,
+    MENU_ITEM_PUBLIC_LIST,
     MenuItemCreate,
     MenuItemResponse,
     MenuItemPublic,
     MenuCategoryGroupPublic,
 )
 from backend.services.menu_service import MenuService
+from backend.utils.responses import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +54,9 @@ def list_menu_items(
     """Return a list of menu items (public)."""
     logger.info("Listing menu items")
     service = MenuService(conn)
-    return service.list_menu_items()
+    # Rows are plain dicts, so validate them on the dict path in one call
+    items = MENU_ITEM_PUBLIC_LIST.validate_python(service.list_menu_items())
+    return json_response(MENU_ITEM_PUBLIC_LIST, items)
 
 
 @router.get(
@@ -65,7 +70,10 @@ def list_menu_by_category(
     """Return menu items grouped by category (public)."""
     logger.info("Listing menu items grouped by category")
     service = MenuService(conn)
-    return service.list_grouped_by_category()
+    groups = MENU_CATEGORY_GROUP_PUBLIC_LIST.validate_python(
+        service.list_grouped_by_category()
+    )
+    return json_response(MENU_CATEGORY_GROUP_PUBLIC_LIST, groups)
 
 
 @router.delete(
@@ -17,12 +17,15 @@ from backend.core.dependencies import (
 )
 from backend.models.user import User
 from backend.schemas.stock import (
+    STOCK_CATEGORY_GROUP_LIST,
+    STOCK_ENTRY_RESPONSE_LIST,
     StockCreate,
     StockUpdate,
     StockEntryResponse,
     StockCategoryGroup,
 )
 from backend.services.stock_service import StockService
+from backend.utils.responses import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +66,11 @@ def list_stock(
     """Return a flat list of all stock entries ordered by item_id."""
     logger.info("Listing stock entries")
     service = StockService(conn)
-    return service.list_entries()
+    entries = service.list_entries()
+    return json_response(
+        STOCK_ENTRY_RESPONSE_LIST,
+        [StockEntryResponse.from_model(entry) for entry in entries],
+    )
 
 
 @router.get(
@@ -81,7 +88,9 @@ def list_stock_by_category(
     """
     logger.info("Listing stock grouped by category")
     service = StockService(conn)
-    return service.list_grouped_by_category()
+    # Rows are plain dicts, so validate them on the dict path in one call
+    groups = STOCK_CATEGORY_GROUP_LIST.validate_python(service.list_grouped_by_category())
+    return json_response(STOCK_CATEGORY_GROUP_LIST, groups)
 
 
 @router.get(
@@ -25,6 +25,7 @@ from backend.core.dependencies import (
 from backend.models.user import User
 from backend.models.time_entry import TimeEntryStatus
 from backend.schemas.time_entry import (
+    TIME_ENTRY_RESPONSE_LIST,
     TimeEntryCreate,
     TimeEntryUpdate,
     TimeEntryReview,
@@ -32,6 +33,7 @@ from backend.schemas.time_entry import (
     GroupedTimeEntriesResponse,
 )
 from backend.services.time_entry_service import TimeEntryService
+from backend.utils.responses import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +80,11 @@ def list_my_entries(
     """Return all time entries for the current user."""
     logger.info("Listing time entries for user id=%s", current_user.id)
     service = TimeEntryService(conn)
-    return service.list_my_entries(current_user, status)
+    entries = service.list_my_entries(current_user, status)
+    return json_response(
+        TIME_ENTRY_RESPONSE_LIST,
+        [TimeEntryResponse.from_model(entry) for entry in entries],
+    )
 
 
 @router.get(
@@ -93,7 +99,11 @@ def list_pending_entries(
     """Return all pending time entries for review."""
     logger.info("Listing pending time entries")
     service = TimeEntryService(conn)
-    return service.list_pending_entries()
+    entries = service.list_pending_entries()
+    return json_response(
+        TIME_ENTRY_RESPONSE_LIST,
+        [TimeEntryResponse.from_model(entry) for entry in entries],
+    )
 
 
 @router.get(
@@ -118,7 +128,11 @@ def list_entries_by_date_range(
         end_date,
     )
     service = TimeEntryService(conn)
-    return service.list_entries_by_date_range(start_date, end_date, status)
+    entries = service.list_entries_by_date_range(start_date, end_date, status)
+    return json_response(
+        TIME_ENTRY_RESPONSE_LIST,
+        [TimeEntryResponse.from_model(entry) for entry in entries],
+    )
 
 
 @router.get(
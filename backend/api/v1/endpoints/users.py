@@ -16,8 +16,9 @@ from backend.core.dependencies import (
     require_admin_or_owner,
 )
 from backend.models.user import User, UserRole
-from backend.schemas.user import UserCreate, UserUpdate, UserResponse
+from backend.schemas.user import USER_RESPONSE_LIST, UserCreate, UserUpdate, UserResponse
 from backend.services.user_service import UserService
+from backend.utils.responses import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -54,25 +55,32 @@ def register_user(
     summary="List all users (Admin) or Employees (Market Owner)",
 )
 def list_users(
+    limit: int = Query(100, ge=1, le=500, description="Number of users to return"),
+    offset: int = Query(0, ge=0, description="Number of users to skip"),
     include_deleted: bool = Query(False, description="Include soft-deleted users"),
     conn=Depends(db_dependency),
     current_user: User = Depends(require_admin_or_owner),
 ):
     """
-    Return a list of users.
+    Return a page of users ordered by id.
     - **Admins**: See all users.
     - **Market Owners**: See only employees.
     Pass `?include_deleted=true` to also see soft-deleted accounts.
+    The total number of matching users is returned in `X-Total-Count`.
     """
     logger.info("Listing users include_deleted=%s", include_deleted)
     service = UserService(conn)
-    users = service.list_users(include_deleted=include_deleted)
-    
-    if current_user.role == UserRole.MARKET_OWNER:
-        # Filter for employees only
-        return [u for u in users if u.role == UserRole.EMPLOYEE]
-        
-    return users
+    # Market owners only see employees; filter in SQL so pages stay full
+    role = UserRole.EMPLOYEE if current_user.role == UserRole.MARKET_OWNER else None
+    total = service.count_users(include_deleted=include_deleted, role=role)
+    users = service.list_users(
+        limit=limit, offset=offset, include_deleted=include_deleted, role=role
+    )
+    return json_response(
+        USER_RESPONSE_LIST,
+        [UserResponse.from_model(user) for user in users],
+        headers={"X-Total-Count": str(total)},
+    )
 
 
 @router.get(
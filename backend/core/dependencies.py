@@ -33,6 +33,17 @@ def db_dependency() -> Generator:
 # Auth dependencies
 # ---------------------------------------------------------------------------
 
+def _credentials_exception() -> HTTPException:
+    """Build the 401 raised for any invalid access token."""
+    # Built per failure: exceptions carry their traceback, so an instance
+    # is never shared between raises, and the success path allocates none
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
 def get_current_user(
     token: str = Depends(oauth2_scheme),
     conn=Depends(db_dependency),
@@ -41,29 +52,24 @@ def get_current_user(
     Decode the Bearer access token and return the corresponding User.
     Raises HTTP 401 if the token is invalid, expired, or the user is not found.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
     try:
         payload = decode_token(token)
         if payload.get("type") != "access":
             logger.warning("Access token type mismatch")
-            raise credentials_exception
+            raise _credentials_exception()
         user_id: str = payload.get("sub")
         if user_id is None:
             logger.warning("Access token missing subject")
-            raise credentials_exception
+            raise _credentials_exception()
     except JWTError:
         logger.error("Failed to decode access token", exc_info=True)
-        raise credentials_exception
+        raise _credentials_exception()
 
     repo = UserRepository(conn)
     user = repo.get_by_id(int(user_id))
     if user is None or user.is_deleted:
         logger.warning("User not found or deleted for token subject")
-        raise credentials_exception
+        raise _credentials_exception()
     logger.info("Authenticated user id=%s", user.id)
     return user
 
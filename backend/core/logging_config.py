@@ -98,40 +98,33 @@ def configure_logging() -> None:
     root_logger.addHandler(file_handler)
 
 
+def _format_db_args(args: tuple, kwargs: dict) -> str:
+    """Render call arguments for DB_OP log lines (skipping 'self' and 'conn')."""
+    arg_parts = []
+    if len(args) > 1:
+        # Skip 'self' (args[0]) and 'conn' if present (args[1] is often conn)
+        display_args = args[2:] if len(args) > 2 else args[1:]
+        for arg in display_args:
+            arg_parts.append(str(arg))
+    for key, value in kwargs.items():
+        arg_parts.append(f"{key}={value}")
+    return ", ".join(arg_parts) if arg_parts else ""
+
+
 def log_db_timing(func: F) -> F:
     """
     Decorator to log the execution time of database operations.
     Logs the function name, arguments (excluding 'self' and 'conn'),
     and the duration in milliseconds.
     """
+    # Resolved once per decorated function rather than on every call
+    logger = logging.getLogger(func.__module__)
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        # Get logger from the class instance (first arg is 'self')
-        logger = logging.getLogger(func.__module__)
-        
-        # Build args string (skip 'self' and 'conn' for cleaner logs)
-        arg_parts = []
-        if len(args) > 1:
-            # Skip 'self' (args[0]) and 'conn' if present (args[1] is often conn)
-            display_args = args[2:] if len(args) > 2 else args[1:]
-            for arg in display_args:
-                arg_parts.append(str(arg))
-        for key, value in kwargs.items():
-            arg_parts.append(f"{key}={value}")
-        args_str = ", ".join(arg_parts) if arg_parts else ""
-        
         start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            logger.info(
-                "DB_OP | %s.%s | duration=%.3fms | args=(%s)",
-                func.__qualname__,
-                func.__name__,
-                elapsed_ms,
-                args_str
-            )
-            return result
         except Exception as e:
             elapsed_ms = (time.perf_counter() - start_time) * 1000
             logger.error(
@@ -139,8 +132,19 @@ def log_db_timing(func: F) -> F:
                 func.__qualname__,
                 func.__name__,
                 elapsed_ms,
-                args_str,
+                _format_db_args(args, kwargs),
                 str(e)
             )
             raise
+        # Only stringify the arguments when the line will actually be emitted
+        if logger.isEnabledFor(logging.INFO):
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            logger.info(
+                "DB_OP | %s.%s | duration=%.3fms | args=(%s)",
+                func.__qualname__,
+                func.__name__,
+                elapsed_ms,
+                _format_db_args(args, kwargs),
+            )
+        return result
     return wrapper  # type: ignore[return-value]
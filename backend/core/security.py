@@ -69,14 +69,15 @@ def create_access_token(user_id: int, role: str) -> str:
     )
 
 
-def create_refresh_token(user_id: int, role: str) -> str:
-    """Create a long-lived refresh token (7 days)."""
+def create_refresh_token(user_id: int, role: str, jti: Optional[str] = None) -> str:
+    """Create a long-lived refresh token (7 days), tagged with *jti* if given."""
     logger.trace("Creating refresh token for user id=%s", user_id)
     return _create_token(
         subject=str(user_id),
         role=role,
         token_type="refresh",
         expires_delta=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        extra_claims={"jti": jti} if jti else None,
     )
 
 
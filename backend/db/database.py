@@ -4,6 +4,7 @@ import logging
 import os
 import sqlite3
 from contextlib import contextmanager
+from decimal import Decimal
 
 from backend.core.config import settings
 
@@ -17,13 +18,31 @@ db_dir = os.path.dirname(DB_PATH) if os.path.dirname(DB_PATH) else "."
 os.makedirs(db_dir, exist_ok=True)
 logger.info("Database directory ensured at %s", db_dir)
 
+# Let repositories bind Decimal quantities and prices directly. The columns
+# are REAL, so the value is stored as the same double float() would give.
+sqlite3.register_adapter(Decimal, float)
+
+# INSERT/UPDATE ... RETURNING is only available from SQLite 3.35.0 onwards
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Per-connection tuning applied every time a connection is opened.
+# journal_mode=WAL is persistent in the database file and is set once in init_db().
+CONNECTION_PRAGMAS = [
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",   # 256 MiB
+    "PRAGMA cache_size = -65536",     # 64 MiB
+]
+
 
 def get_connection() -> sqlite3.Connection:
     """Create and return a new SQLite connection with row factory."""
     logger.trace("Opening database connection to %s", DB_PATH)
     conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
@@ -44,8 +63,57 @@ def get_db():
         logger.trace("Database connection closed")
 
 
+def begin_immediate(conn: sqlite3.Connection) -> None:
+    """
+    Open a write transaction on *conn* now, unless one is already active.
+
+    Read-check-write sequences (e.g. stock checks before a decrement) take
+    the write lock before their first read, so concurrent requests cannot
+    both pass a check, and the writes still share the single commit made
+    by get_db().
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+
+
 def init_db() -> None:
     """Initialize the database by creating all tables."""
     logger.info("Initializing database schema")
+    conn = get_connection()
+    try:
+        # WAL lets readers proceed while a writer is active; SQLite's default
+        # wal_autocheckpoint (1000 pages) keeps the -wal file bounded.
+        journal_mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        logger.info("Database journal_mode=%s", journal_mode)
+    finally:
+        conn.close()
     from backend.db import schema  # noqa: F401 – triggers table creation
     schema.create_tables()
+
+
+def purge_expired_refresh_tokens() -> int:
+    """
+    Delete every expired refresh token on a dedicated connection.
+
+    Each batch is committed on its own so the write lock and the WAL stay
+    bounded however many tokens have expired. Returns the count removed.
+    """
+    from backend.repositories.token_repository import TokenRepository
+
+    conn = get_connection()
+    try:
+        repo = TokenRepository(conn)
+        deleted = 0
+        while True:
+            count = repo.delete_expired_batch()
+            conn.commit()
+            deleted += count
+            if count < repo.DELETE_BATCH_SIZE:
+                break
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    logger.info("Purged %s expired refresh tokens", deleted)
+    return deleted
@@ -17,6 +17,7 @@ from backend.repositories.user_repository import UserRepository
 from backend.repositories.cart_repository import CartRepository
 from backend.repositories.menu_repository import MenuRepository
 from backend.repositories.time_entry_repository import TimeEntryRepository
+from backend.models.cart import CartStatus
 from backend.models.time_entry import TimeEntryStatus
 from backend.models.user import UserRole
 from backend.core.security import hash_password
@@ -142,7 +143,7 @@ def seed_mock_data() -> None:
         menu_repo = MenuRepository(conn)
 
         # Get the first user (admin) to use as creator
-        users = user_repo.list_all()
+        users = user_repo.list_all(limit=1)
         if not users:
             logger.warning("Mock seeder: No users found. Skipping mock data creation.")
             return
@@ -248,8 +249,11 @@ def seed_mock_data() -> None:
                 carts.append(existing)
                 continue
             cart = cart_repo.create(created_by=creator_id)
-            cart_repo.update_desk_number(cart.id, desk, creator_id)
-            carts.append(cart_repo.get_by_id(cart.id))
+            carts.append(
+                cart_repo.update_desk_number_if(
+                    cart.id, desk, (CartStatus.DRAFT,), creator_id
+                )
+            )
         logger.info("Mock seeder: Created %s carts with desk numbers", len(carts))
 
         if carts:
@@ -37,9 +37,10 @@ CREATE TABLE IF NOT EXISTS refresh_tokens (
     id          INTEGER PRIMARY KEY AUTOINCREMENT,
     user_id     INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
     token       TEXT    NOT NULL UNIQUE,
-    expires_at  TEXT    NOT NULL,
+    expires_at  INTEGER NOT NULL,
     revoked     INTEGER NOT NULL DEFAULT 0,
-    created_at  TEXT    NOT NULL DEFAULT (datetime('now'))
+    created_at  TEXT    NOT NULL DEFAULT (datetime('now')),
+    jti         TEXT
 );
 """
 
@@ -111,7 +112,8 @@ CREATE TABLE IF NOT EXISTS carts (
     created_by   INTEGER NOT NULL REFERENCES users(id) ON DELETE SET NULL,
     updated_by   INTEGER NOT NULL REFERENCES users(id) ON DELETE SET NULL,
     created_at   TEXT    NOT NULL DEFAULT (datetime('now')),
-    updated_at   TEXT    NOT NULL DEFAULT (datetime('now'))
+    updated_at   TEXT    NOT NULL DEFAULT (datetime('now')),
+    version      INTEGER NOT NULL DEFAULT 0
 );
 """
 
@@ -206,8 +208,99 @@ MIGRATIONS = [
     ("carts", "desk_number", "ALTER TABLE carts ADD COLUMN desk_number TEXT"),
     ("carts", "status", "ALTER TABLE carts ADD COLUMN status TEXT NOT NULL DEFAULT 'draft' CHECK(status IN ('draft', 'deleted', 'completed'))"),
     ("time_entries", "end_date", "ALTER TABLE time_entries ADD COLUMN end_date TEXT"),
+    ("refresh_tokens", "jti", "ALTER TABLE refresh_tokens ADD COLUMN jti TEXT"),
+    ("carts", "version", "ALTER TABLE carts ADD COLUMN version INTEGER NOT NULL DEFAULT 0"),
 ]
 
+# Column type changes cannot be expressed with ALTER TABLE in SQLite, so the
+# table is rebuilt from the current DDL and the old rows are copied across.
+# refresh_tokens.expires_at moved from ISO-8601 TEXT to INTEGER epoch seconds.
+REBUILD_REFRESH_TOKENS_SQL = [
+    "ALTER TABLE refresh_tokens RENAME TO refresh_tokens_legacy",
+    CREATE_REFRESH_TOKENS_TABLE,
+    """
+    INSERT INTO refresh_tokens (id, user_id, token, expires_at, revoked, created_at, jti)
+    SELECT id, user_id, token, CAST(strftime('%s', expires_at) AS INTEGER),
+           revoked, created_at, jti
+      FROM refresh_tokens_legacy
+    """,
+    "DROP TABLE refresh_tokens_legacy",
+]
+
+# ---------------------------------------------------------------------------
+# Indexes (IF NOT EXISTS – safe on every restart)
+# ---------------------------------------------------------------------------
+# refresh_tokens.token, users.email, users.username, stock_entries.item_id and
+# cart_items(cart_id, item_id) are already covered by the implicit indexes
+# SQLite builds for their UNIQUE constraints.
+
+CREATE_REFRESH_TOKENS_USER_ACTIVE_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_refresh_tokens_user_active
+    ON refresh_tokens(user_id, revoked);
+"""
+
+CREATE_REFRESH_TOKENS_EXPIRES_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_refresh_tokens_expires
+    ON refresh_tokens(expires_at);
+"""
+
+# Tokens issued before the jti claim existed keep jti NULL; SQLite allows
+# any number of NULLs under a UNIQUE index.
+CREATE_REFRESH_TOKENS_JTI_INDEX = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_refresh_tokens_jti
+    ON refresh_tokens(jti);
+"""
+
+CREATE_USERS_LISTING_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_users_is_deleted_id
+    ON users(is_deleted, id);
+"""
+
+# Serves cart version bumps on item edits and the ON DELETE RESTRICT check
+# when an item is deleted
+CREATE_CART_ITEMS_ITEM_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_cart_items_item_id
+    ON cart_items(item_id);
+"""
+
+# Serves the created_at range scans behind cart listings and daily closes
+CREATE_CARTS_CREATED_AT_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_carts_created_at
+    ON carts(created_at);
+"""
+
+# ---------------------------------------------------------------------------
+# Triggers (IF NOT EXISTS – safe on every restart)
+# ---------------------------------------------------------------------------
+# Inserting or re-quantifying a cart item stamps the parent cart with the
+# same user/timestamp and bumps its contents version, so these writes need
+# no separate CartRepository.touch() round-trip. Deletes carry no acting
+# user and are still followed by touch().
+
+CREATE_CART_ITEMS_INSERT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS trg_cart_items_insert_touch_cart
+AFTER INSERT ON cart_items
+BEGIN
+    UPDATE carts
+       SET updated_by = NEW.updated_by,
+           updated_at = NEW.updated_at,
+           version    = version + 1
+     WHERE id = NEW.cart_id;
+END;
+"""
+
+CREATE_CART_ITEMS_UPDATE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS trg_cart_items_update_touch_cart
+AFTER UPDATE OF quantity ON cart_items
+BEGIN
+    UPDATE carts
+       SET updated_by = NEW.updated_by,
+           updated_at = NEW.updated_at,
+           version    = version + 1
+     WHERE id = NEW.cart_id;
+END;
+"""
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -226,6 +319,20 @@ ALL_TABLES = [
     CREATE_TIME_ENTRIES_TABLE,
 ]
 
+ALL_INDEXES = [
+    CREATE_REFRESH_TOKENS_USER_ACTIVE_INDEX,
+    CREATE_REFRESH_TOKENS_EXPIRES_INDEX,
+    CREATE_REFRESH_TOKENS_JTI_INDEX,
+    CREATE_USERS_LISTING_INDEX,
+    CREATE_CART_ITEMS_ITEM_INDEX,
+    CREATE_CARTS_CREATED_AT_INDEX,
+]
+
+ALL_TRIGGERS = [
+    CREATE_CART_ITEMS_INSERT_TRIGGER,
+    CREATE_CART_ITEMS_UPDATE_TRIGGER,
+]
+
 
 def _column_exists(conn, table: str, column: str) -> bool:
     """Return True when a column exists in the given table."""
@@ -234,6 +341,13 @@ def _column_exists(conn, table: str, column: str) -> bool:
     return any(r["name"] == column for r in rows)
 
 
+def _column_type(conn, table: str, column: str) -> str:
+    """Return the declared type of a column, or an empty string if missing."""
+    logger.trace("Checking column type table=%s column=%s", table, column)
+    rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
+    return next((r["type"].upper() for r in rows if r["name"] == column), "")
+
+
 def create_tables() -> None:
     """Create all tables and apply incremental migrations."""
     logger.info("Creating database tables and applying migrations")
@@ -251,7 +365,22 @@ def create_tables() -> None:
                 logger.warning("Applying migration for %s.%s", table, column)
                 cursor.execute(alter_sql)
 
+        # 3. Rebuild refresh_tokens while expires_at is still stored as TEXT
+        if _column_type(conn, "refresh_tokens", "expires_at") != "INTEGER":
+            logger.warning("Migrating refresh_tokens.expires_at to INTEGER epoch")
+            for sql in REBUILD_REFRESH_TOKENS_SQL:
+                cursor.execute(sql)
+
+        # 4. Create indexes and triggers after migrations so every column exists
+        for ddl in ALL_INDEXES:
+            cursor.execute(ddl)
+        for ddl in ALL_TRIGGERS:
+            cursor.execute(ddl)
+
         conn.commit()
+
+        # 5. Refresh planner statistics where SQLite judges them stale
+        cursor.execute("PRAGMA optimize")
         logger.info("Database schema ready")
     finally:
         conn.close()
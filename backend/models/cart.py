@@ -22,6 +22,7 @@ class Cart:
     updated_by: int
     created_at: datetime
     updated_at: datetime
+    version: int = 0
 
     def __post_init__(self) -> None:
         """Log the creation of the Cart model instance."""
@@ -45,4 +46,5 @@ class Cart:
             updated_by=row["updated_by"],
             created_at=datetime.fromisoformat(row["created_at"]),
             updated_at=datetime.fromisoformat(row["updated_at"]),
+            version=row["version"],
         )
@@ -2,7 +2,8 @@
 Domain model representing a stored refresh token row.
 """
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
 
 
 @dataclass
@@ -10,9 +11,11 @@ class RefreshToken:
     id: int
     user_id: int
     token: str
-    expires_at: datetime
+    # Stored as INTEGER epoch seconds; kept raw so expiry checks compare ints
+    expires_at_epoch: int
     revoked: bool
     created_at: datetime
+    jti: Optional[str] = None
 
     def __post_init__(self) -> None:
         """Log the creation of the RefreshToken model instance."""
@@ -21,6 +24,11 @@ class RefreshToken:
         logger = logging.getLogger(__name__)
         logger.trace("Initialized RefreshToken model id=%s", self.id)
 
+    @property
+    def expires_at(self) -> datetime:
+        """Return the expiry as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.expires_at_epoch, tz=timezone.utc)
+
     @classmethod
     def from_row(cls, row) -> "RefreshToken":
         """Build a RefreshToken from a sqlite3.Row object."""
@@ -32,7 +40,26 @@ class RefreshToken:
             id=row["id"],
             user_id=row["user_id"],
             token=row["token"],
-            expires_at=datetime.fromisoformat(row["expires_at"]),
+            expires_at_epoch=row["expires_at"],
             revoked=bool(row["revoked"]),
             created_at=datetime.fromisoformat(row["created_at"]),
+            jti=row["jti"],
+        )
+
+    @classmethod
+    def from_tuple(cls, row: tuple) -> "RefreshToken":
+        """
+        Build a RefreshToken from a plain tuple row.
+
+        The tuple must follow the column order id, user_id, token,
+        expires_at, revoked, created_at, jti.
+        """
+        return cls(
+            id=row[0],
+            user_id=row[1],
+            token=row[2],
+            expires_at_epoch=row[3],
+            revoked=bool(row[4]),
+            created_at=datetime.fromisoformat(row[5]),
+            jti=row[6],
         )
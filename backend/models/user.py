@@ -56,3 +56,57 @@ class User:
             created_at=datetime.fromisoformat(row["created_at"]),
             updated_at=datetime.fromisoformat(row["updated_at"]),
         )
+
+    @classmethod
+    def from_tuple(cls, row: tuple) -> "User":
+        """
+        Build a User from a plain tuple row.
+
+        The tuple must follow the column order id, email, username,
+        full_name, hashed_password, role, is_active, is_deleted, deleted_at,
+        created_at, updated_at.
+        """
+        deleted_at_raw = row[8]
+        return cls(
+            id=row[0],
+            email=row[1],
+            username=row[2],
+            full_name=row[3],
+            hashed_password=row[4],
+            role=UserRole(row[5]),
+            is_active=bool(row[6]),
+            is_deleted=bool(row[7]),
+            deleted_at=datetime.fromisoformat(deleted_at_raw) if deleted_at_raw else None,
+            created_at=datetime.fromisoformat(row[9]),
+            updated_at=datetime.fromisoformat(row[10]),
+        )
+
+    @classmethod
+    def from_rows(cls, rows) -> list["User"]:
+        """
+        Build Users from many sqlite3.Row objects.
+
+        Instances are populated directly, bypassing __init__/__post_init__,
+        so bulk listings avoid the per-row constructor and trace log call.
+        """
+        parse_dt = datetime.fromisoformat
+        new = object.__new__
+        users = []
+        for row in rows:
+            user = new(cls)
+            deleted_at_raw = row["deleted_at"]
+            user.__dict__.update(
+                id=row["id"],
+                email=row["email"],
+                username=row["username"],
+                hashed_password=row["hashed_password"],
+                role=UserRole(row["role"]),
+                is_active=bool(row["is_active"]),
+                is_deleted=bool(row["is_deleted"]),
+                created_at=parse_dt(row["created_at"]),
+                updated_at=parse_dt(row["updated_at"]),
+                full_name=row["full_name"],
+                deleted_at=parse_dt(deleted_at_raw) if deleted_at_raw else None,
+            )
+            users.append(user)
+        return users
@@ -2,18 +2,70 @@
 Repository layer for Cart persistence.
 All SQL for the `carts` table lives here.
 """
+import json
 import sqlite3
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import Iterator, Optional
 import logging
 
 from backend.models.cart import Cart, CartStatus
 from backend.models.cart_item import CartItem
 from backend.core.logging_config import log_db_timing
+from backend.db.database import SUPPORTS_RETURNING
+from backend.utils.money import from_cents
 
 logger = logging.getLogger(__name__)
 
+_CART_ITEM_COLUMNS = (
+    "id", "cart_id", "item_id", "quantity",
+    "created_by", "updated_by", "created_at", "updated_at",
+)
+
+# RETURNING reports the bound value before REAL affinity is applied, so
+# quantity is cast to read back the same as a plain SELECT
+_CART_ITEM_RETURNING = """
+    RETURNING id, cart_id, item_id, CAST(quantity AS REAL) AS quantity,
+              created_by, updated_by, created_at, updated_at
+"""
+
+# Per-line pricing in integer cents for the cart_items rows matched by
+# {cart_filter}: the subtotal is rounded half-up to the cent, then the
+# discount (in basis points) and the tax on the discounted amount are each
+# rounded the same way. Running this in SQLite keeps the arithmetic out of
+# the Python loop, and every cart total is built from these same lines.
+_CART_LINE_CENTS_TEMPLATE = """
+    WITH lines AS (
+        SELECT ci.id,
+               ci.cart_id,
+               ci.quantity,
+               i.id AS item_id,
+               i.name,
+               i.sku,
+               i.unit_price,
+               i.discount_rate,
+               i.tax_rate,
+               (CAST(ROUND(i.unit_price * 100) AS INTEGER)
+                * CAST(ROUND(ci.quantity * 1000) AS INTEGER) + 500) / 1000 AS subtotal,
+               CAST(ROUND(i.discount_rate * 100) AS INTEGER) AS discount_bps,
+               CAST(ROUND(i.tax_rate * 100) AS INTEGER)      AS tax_bps
+          FROM cart_items ci
+          JOIN items i ON i.id = ci.item_id
+         WHERE {cart_filter}
+    ), discounted AS (
+        SELECT *, (subtotal * discount_bps + 5000) / 10000 AS discount
+          FROM lines
+    )
+"""
+
+# Lines of the single cart bound to "?"
+_CART_LINE_CENTS_SQL = _CART_LINE_CENTS_TEMPLATE.format(cart_filter="ci.cart_id = ?")
+
+# Lines of every cart that has a desk number
+_DESK_CART_LINE_CENTS_SQL = _CART_LINE_CENTS_TEMPLATE.format(
+    cart_filter="ci.cart_id IN (SELECT id FROM carts WHERE desk_number IS NOT NULL)"
+)
+
 
 class CartRepository:
     """Data access layer for cart records."""
@@ -48,13 +100,35 @@ class CartRepository:
         return Cart.from_row(row) if row else None
 
     @log_db_timing
-    def list_with_desk_number(self) -> list[Cart]:
-        """List all carts that have a desk number assigned."""
+    def list_with_desk_number(self) -> list[tuple[Cart, int, Decimal]]:
+        """List carts that have a desk number as (cart, item count, total) tuples."""
         logger.trace("Listing carts with desk_number")
+        # Totals are summed from the same rounded lines as sum_cart_totals, so
+        # the listing always agrees with the cart's own totals
         rows = self._conn.execute(
-            "SELECT * FROM carts WHERE desk_number IS NOT NULL ORDER BY desk_number"
+            _DESK_CART_LINE_CENTS_SQL
+            + """
+            , cart_totals AS (
+                SELECT cart_id,
+                       COUNT(*) AS item_count,
+                       SUM(subtotal - discount
+                           + ((subtotal - discount) * tax_bps + 5000) / 10000) AS total_cents
+                  FROM discounted
+                 GROUP BY cart_id
+            )
+            SELECT c.*,
+                   COALESCE(t.item_count, 0)  AS item_count,
+                   COALESCE(t.total_cents, 0) AS total_cents
+              FROM carts c
+              LEFT JOIN cart_totals t ON t.cart_id = c.id
+             WHERE c.desk_number IS NOT NULL
+             ORDER BY c.desk_number
+            """
         ).fetchall()
-        return [Cart.from_row(r) for r in rows]
+        return [
+            (Cart.from_row(r), r["item_count"], from_cents(r["total_cents"]))
+            for r in rows
+        ]
 
     @log_db_timing
     def list_by_date_range(
@@ -133,10 +207,11 @@ class CartRepository:
         if not cart_rows:
             return []
         
-        cart_ids = tuple(row["id"] for row in cart_rows)
-        placeholders = ", ".join("?" for _ in cart_ids)
+        # Bind the ids as one JSON array so the statement text is the same for
+        # any number of carts and stays in sqlite3's statement cache
+        cart_ids = json.dumps([row["id"] for row in cart_rows])
         item_rows = self._conn.execute(
-            f"""
+            """
             SELECT 
                 ci.cart_id,
                 ci.id AS cart_item_id,
@@ -149,10 +224,10 @@ class CartRepository:
                 i.tax_rate
             FROM cart_items ci
             JOIN items i ON i.id = ci.item_id
-            WHERE ci.cart_id IN ({placeholders})
+            WHERE ci.cart_id IN (SELECT value FROM json_each(?))
             ORDER BY ci.cart_id, ci.id
             """,
-            cart_ids,
+            (cart_ids,),
         ).fetchall()
         
         items_by_cart: dict[int, list[dict]] = {}
@@ -184,54 +259,121 @@ class CartRepository:
         """Insert a new cart and return the created record."""
         logger.info("Creating cart record created_by=%s", created_by)
         now = datetime.now(tz=timezone.utc).isoformat()
+        params = (created_by, created_by, now, now)
+        if SUPPORTS_RETURNING:
+            row = self._conn.execute(
+                """
+                INSERT INTO carts (created_by, updated_by, created_at, updated_at)
+                VALUES (?, ?, ?, ?)
+                RETURNING *
+                """,
+                params,
+            ).fetchone()
+            return Cart.from_row(row)
+
         cursor = self._conn.execute(
             """
             INSERT INTO carts (created_by, updated_by, created_at, updated_at)
             VALUES (?, ?, ?, ?)
             """,
-            (created_by, created_by, now, now),
+            params,
         )
         return self.get_by_id(cursor.lastrowid)  # type: ignore[return-value]
 
     @log_db_timing
-    def update_desk_number(self, cart_id: int, desk_number: str | None, updated_by: int) -> Optional[Cart]:
-        """Update a cart's desk number and return the updated row."""
+    def update_desk_number_if(
+        self,
+        cart_id: int,
+        desk_number: str | None,
+        from_statuses: tuple[CartStatus, ...],
+        updated_by: int,
+    ) -> Optional[Cart]:
+        """
+        Set a cart's desk number only while its status is in *from_statuses*.
+
+        Returns the updated cart, or None if the cart is missing or in
+        another status.
+        """
         logger.info("Updating cart id=%s desk_number=%s", cart_id, desk_number)
+        return self._update_if(
+            "desk_number = ?", (desk_number,), cart_id, from_statuses, updated_by
+        )
+
+    @log_db_timing
+    def update_status_if(
+        self,
+        cart_id: int,
+        from_statuses: tuple[CartStatus, ...],
+        to_status: CartStatus,
+        updated_by: int,
+    ) -> Optional[Cart]:
+        """
+        Move a cart to *to_status* only if its status is in *from_statuses*.
+
+        Returns the updated cart, or None if the cart is missing or in
+        another status.
+        """
+        logger.info("Updating cart id=%s status=%s", cart_id, to_status.value)
+        return self._update_if(
+            "status = ?", (to_status.value,), cart_id, from_statuses, updated_by
+        )
+
+    def _update_if(
+        self,
+        set_clause: str,
+        set_params: tuple,
+        cart_id: int,
+        from_statuses: tuple[CartStatus, ...],
+        updated_by: int,
+    ) -> Optional[Cart]:
+        """Run a status-guarded UPDATE on one cart and return the new row."""
         now = datetime.now(tz=timezone.utc).isoformat()
-        self._conn.execute(
-            """
+        sql = f"""
             UPDATE carts
-               SET desk_number = ?, updated_by = ?, updated_at = ?
+               SET {set_clause}, updated_by = ?, updated_at = ?
              WHERE id = ?
-            """,
-            (desk_number, updated_by, now, cart_id),
+               AND status IN (SELECT value FROM json_each(?))
+            """
+        params = (
+            *set_params,
+            updated_by,
+            now,
+            cart_id,
+            json.dumps([s.value for s in from_statuses]),
         )
-        return self.get_by_id(cart_id)
+        if SUPPORTS_RETURNING:
+            row = self._conn.execute(sql + " RETURNING *", params).fetchone()
+            return Cart.from_row(row) if row else None
+
+        cursor = self._conn.execute(sql, params)
+        return self.get_by_id(cart_id) if cursor.rowcount else None
 
     @log_db_timing
-    def update_status(self, cart_id: int, status: CartStatus, updated_by: int) -> Optional[Cart]:
-        """Update a cart's status and return the updated row."""
-        logger.info("Updating cart id=%s status=%s", cart_id, status.value)
+    def touch(self, cart_id: int, updated_by: int) -> None:
+        """Update the updated_at timestamp for a cart and bump its contents version."""
         now = datetime.now(tz=timezone.utc).isoformat()
         self._conn.execute(
             """
             UPDATE carts
-               SET status = ?, updated_by = ?, updated_at = ?
+               SET updated_by = ?, updated_at = ?, version = version + 1
              WHERE id = ?
             """,
-            (status.value, updated_by, now, cart_id),
+            (updated_by, now, cart_id),
         )
-        return self.get_by_id(cart_id)
 
     @log_db_timing
-    def touch(self, cart_id: int, updated_by: int) -> None:
-        """Update the updated_at timestamp for a cart."""
-        logger.trace("Touching cart id=%s", cart_id)
-        now = datetime.now(tz=timezone.utc).isoformat()
-        self._conn.execute(
-            "UPDATE carts SET updated_by = ?, updated_at = ? WHERE id = ?",
-            (updated_by, now, cart_id),
+    def bump_versions_for_item(self, item_id: int) -> int:
+        """Bump the version of every cart holding *item_id* and return the count."""
+        logger.trace("Bumping cart versions for item id=%s", item_id)
+        cursor = self._conn.execute(
+            """
+            UPDATE carts
+               SET version = version + 1
+             WHERE id IN (SELECT cart_id FROM cart_items WHERE item_id = ?)
+            """,
+            (item_id,),
         )
+        return cursor.rowcount
 
     # ------------------------------------------------------------------
     # Cart items
@@ -257,6 +399,155 @@ class CartRepository:
         ).fetchone()
         return CartItem.from_row(row) if row else None
 
+    @log_db_timing
+    def get_cart_item_in_cart(self, cart_id: int, ref: int) -> Optional[CartItem]:
+        """
+        Return the cart item in *cart_id* identified by *ref*.
+
+        *ref* is matched as a cart item id first and as an item id otherwise.
+        """
+        logger.trace("Fetching cart item cart_id=%s ref=%s", cart_id, ref)
+        row = self._conn.execute(
+            """
+            SELECT * FROM cart_items
+             WHERE cart_id = ? AND (id = ? OR item_id = ?)
+             ORDER BY id = ? DESC
+             LIMIT 1
+            """,
+            (cart_id, ref, ref, ref),
+        ).fetchone()
+        return CartItem.from_row(row) if row else None
+
+    @log_db_timing
+    def get_add_item_context(
+        self, cart_id: int, item_id: int
+    ) -> Optional[tuple[Cart, Optional[int], Optional[Decimal], Optional[int]]]:
+        """
+        Load everything add-to-cart needs in one query.
+
+        Returns None if the cart is missing, otherwise
+        (cart, item_id or None, stock quantity or None, existing cart item id or None).
+        """
+        logger.trace("Fetching add-item context cart_id=%s item_id=%s", cart_id, item_id)
+        row = self._conn.execute(
+            """
+            SELECT c.*,
+                   i.id        AS ctx_item_id,
+                   s.quantity  AS ctx_stock_quantity,
+                   ci.id       AS ctx_cart_item_id
+              FROM carts c
+              LEFT JOIN items i ON i.id = ?
+              LEFT JOIN stock_entries s ON s.item_id = i.id
+              LEFT JOIN cart_items ci ON ci.cart_id = c.id AND ci.item_id = i.id
+             WHERE c.id = ?
+            """,
+            (item_id, cart_id),
+        ).fetchone()
+        if row is None:
+            return None
+        stock_quantity = row["ctx_stock_quantity"]
+        return (
+            Cart.from_row(row),
+            row["ctx_item_id"],
+            Decimal(str(stock_quantity)) if stock_quantity is not None else None,
+            row["ctx_cart_item_id"],
+        )
+
+    @log_db_timing
+    def get_cart_with_item(
+        self, cart_id: int, cart_item_id: int
+    ) -> Optional[tuple[Cart, Optional[CartItem]]]:
+        """
+        Load a cart and one of its cart items in one query.
+
+        Returns None if the cart is missing, otherwise (cart, cart item or
+        None when *cart_item_id* does not belong to the cart).
+        """
+        logger.trace("Fetching cart id=%s with cart item id=%s", cart_id, cart_item_id)
+        row = self._conn.execute(
+            """
+            SELECT c.*,
+                   ci.id         AS ci_id,
+                   ci.cart_id    AS ci_cart_id,
+                   ci.item_id    AS ci_item_id,
+                   ci.quantity   AS ci_quantity,
+                   ci.created_by AS ci_created_by,
+                   ci.updated_by AS ci_updated_by,
+                   ci.created_at AS ci_created_at,
+                   ci.updated_at AS ci_updated_at
+              FROM carts c
+              LEFT JOIN cart_items ci ON ci.id = ? AND ci.cart_id = c.id
+             WHERE c.id = ?
+            """,
+            (cart_item_id, cart_id),
+        ).fetchone()
+        if row is None:
+            return None
+        if row["ci_id"] is None:
+            return Cart.from_row(row), None
+        cart_item = CartItem.from_row(
+            {key: row[f"ci_{key}"] for key in _CART_ITEM_COLUMNS}
+        )
+        return Cart.from_row(row), cart_item
+
+    def iter_cart_lines(self, cart_id: int) -> Iterator[dict]:
+        """
+        Yield cart items joined with their item pricing, ordered by cart item id.
+
+        Each line also carries its subtotal, discount and tax in integer
+        cents (line_subtotal_cents, line_discount_cents, line_tax_cents),
+        computed by _CART_LINE_CENTS_SQL. Rows are read from the cursor as
+        they are consumed rather than fetched into a list up front, so this
+        is not wrapped in log_db_timing: the decorator would only time the
+        execute() call and miss errors raised while iterating.
+        """
+        logger.trace("Iterating cart lines cart_id=%s", cart_id)
+        cursor = self._conn.execute(
+            _CART_LINE_CENTS_SQL
+            + """
+            SELECT id, item_id, name, sku, unit_price, quantity,
+                   discount_rate, tax_rate,
+                   subtotal AS line_subtotal_cents,
+                   discount AS line_discount_cents,
+                   ((subtotal - discount) * tax_bps + 5000) / 10000 AS line_tax_cents
+              FROM discounted
+             ORDER BY id
+            """,
+            (cart_id,),
+        )
+        return (
+            {
+                "id": r["id"],
+                "item_id": r["item_id"],
+                "name": r["name"],
+                "sku": r["sku"],
+                "unit_price": Decimal(r["unit_price"]),
+                "quantity": Decimal(str(r["quantity"])),
+                "discount_rate": Decimal(r["discount_rate"]),
+                "tax_rate": Decimal(r["tax_rate"]),
+                "line_subtotal_cents": r["line_subtotal_cents"],
+                "line_discount_cents": r["line_discount_cents"],
+                "line_tax_cents": r["line_tax_cents"],
+            }
+            for r in cursor
+        )
+
+    @log_db_timing
+    def sum_cart_totals(self, cart_id: int) -> tuple[int, int, int]:
+        """Return (subtotal, discount, tax) in integer cents for a cart."""
+        logger.trace("Summing cart totals cart_id=%s", cart_id)
+        row = self._conn.execute(
+            _CART_LINE_CENTS_SQL
+            + """
+            SELECT COALESCE(SUM(subtotal), 0),
+                   COALESCE(SUM(discount), 0),
+                   COALESCE(SUM(((subtotal - discount) * tax_bps + 5000) / 10000), 0)
+              FROM discounted
+            """,
+            (cart_id,),
+        ).fetchone()
+        return row[0], row[1], row[2]
+
     @log_db_timing
     def list_cart_items_by_cart(self, cart_id: int) -> list[CartItem]:
         """Return all cart items for a given cart."""
@@ -272,22 +563,44 @@ class CartRepository:
         self,
         cart_id: int,
         item_id: int,
-        quantity: float,
+        quantity: Decimal,
         created_by: int,
-    ) -> CartItem:
-        """Insert a new cart item and return it."""
+    ) -> Optional[CartItem]:
+        """
+        Insert a new cart item and return it.
+
+        Returns None, without inserting, if the cart already holds *item_id*.
+        """
         logger.info("Creating cart item cart_id=%s item_id=%s", cart_id, item_id)
         now = datetime.now(tz=timezone.utc).isoformat()
+        params = (cart_id, item_id, quantity, created_by, created_by, now, now)
+        if SUPPORTS_RETURNING:
+            row = self._conn.execute(
+                """
+                INSERT INTO cart_items (
+                    cart_id, item_id, quantity, created_by, updated_by, created_at, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (cart_id, item_id) DO NOTHING
+                """
+                + _CART_ITEM_RETURNING,
+                params,
+            ).fetchone()
+            return CartItem.from_row(row) if row else None
+
         cursor = self._conn.execute(
             """
             INSERT INTO cart_items (
                 cart_id, item_id, quantity, created_by, updated_by, created_at, updated_at
             )
             VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (cart_id, item_id) DO NOTHING
             """,
-            (cart_id, item_id, quantity, created_by, created_by, now, now),
+            params,
         )
-        return self.get_cart_item_by_id(cursor.lastrowid)  # type: ignore[return-value]
+        if cursor.rowcount == 0:
+            return None
+        return self.get_cart_item_by_id(cursor.lastrowid)
 
     @log_db_timing
     def update_cart_item_quantity(
@@ -299,14 +612,17 @@ class CartRepository:
         """Update the quantity for a cart item and return the new row."""
         logger.info("Updating cart item quantity id=%s", cart_item_id)
         now = datetime.now(tz=timezone.utc).isoformat()
-        self._conn.execute(
-            """
+        sql = """
             UPDATE cart_items
                SET quantity = ?, updated_by = ?, updated_at = ?
              WHERE id = ?
-            """,
-            (float(quantity), updated_by, now, cart_item_id),
-        )
+            """
+        params = (quantity, updated_by, now, cart_item_id)
+        if SUPPORTS_RETURNING:
+            row = self._conn.execute(sql + _CART_ITEM_RETURNING, params).fetchone()
+            return CartItem.from_row(row) if row else None
+
+        self._conn.execute(sql, params)
         return self.get_cart_item_by_id(cart_item_id)
 
     @log_db_timing
@@ -52,6 +52,20 @@ class CategoryRepository:
         ).fetchall()
         return [Category.from_row(r) for r in rows]
 
+    @log_db_timing
+    def get_list_version(self) -> tuple[int, Optional[str]]:
+        """
+        Return (row count, latest updated_at) for the categories table.
+
+        Every insert and update stamps updated_at and every delete lowers the
+        count, so the pair changes with each committed write.
+        """
+        logger.trace("Fetching categories list version")
+        row = self._conn.execute(
+            "SELECT COUNT(*), MAX(updated_at) FROM categories"
+        ).fetchone()
+        return row[0], row[1]
+
     # ------------------------------------------------------------------
     # Write
     # ------------------------------------------------------------------
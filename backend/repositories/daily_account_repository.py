@@ -10,6 +10,7 @@ import logging
 from backend.models.daily_account import DailyAccount
 from backend.models.daily_account_item import DailyAccountItem
 from backend.core.logging_config import log_db_timing
+from backend.db.database import SUPPORTS_RETURNING
 
 logger = logging.getLogger(__name__)
 
@@ -87,32 +88,44 @@ class DailyAccountRepository:
         carts_count: int,
         items_count: int,
         created_by: int,
+        closed: bool = False,
     ) -> DailyAccount:
-        """Insert a new daily account and return the created row."""
-        logger.info("Creating daily account date=%s", account_date)
+        """
+        Insert a new daily account and return the created row.
+
+        With *closed*, the row is inserted already closed by *created_by*.
+        """
+        logger.info("Creating daily account date=%s closed=%s", account_date, closed)
         now = datetime.now(tz=timezone.utc).isoformat()
-        cursor = self._conn.execute(
-            """
+        sql = """
             INSERT INTO daily_accounts (
                 account_date, subtotal, discount_total, tax_total, total,
-                carts_count, items_count, created_by, updated_by, created_at, updated_at
+                carts_count, items_count, is_closed, closed_at, closed_by,
+                created_by, updated_by, created_at, updated_at
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                account_date.isoformat(),
-                subtotal,
-                discount_total,
-                tax_total,
-                total,
-                carts_count,
-                items_count,
-                created_by,
-                created_by,
-                now,
-                now,
-            ),
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """
+        params = (
+            account_date.isoformat(),
+            subtotal,
+            discount_total,
+            tax_total,
+            total,
+            carts_count,
+            items_count,
+            1 if closed else 0,
+            now if closed else None,
+            created_by if closed else None,
+            created_by,
+            created_by,
+            now,
+            now,
         )
+        if SUPPORTS_RETURNING:
+            row = self._conn.execute(sql + " RETURNING *", params).fetchone()
+            return DailyAccount.from_row(row)
+
+        cursor = self._conn.execute(sql, params)
         return self.get_by_id(cursor.lastrowid)  # type: ignore[return-value]
 
     @log_db_timing
@@ -124,15 +137,15 @@ class DailyAccountRepository:
         """Mark a daily account as closed and return the updated row."""
         logger.info("Closing daily account id=%s", account_id)
         now = datetime.now(tz=timezone.utc).isoformat()
-        self._conn.execute(
+        return self._update_returning(
             """
             UPDATE daily_accounts
                SET is_closed = 1, closed_at = ?, closed_by = ?, updated_at = ?
              WHERE id = ?
             """,
             (now, closed_by, now, account_id),
+            account_id,
         )
-        return self.get_by_id(account_id)
 
     @log_db_timing
     def open_account(
@@ -143,18 +156,18 @@ class DailyAccountRepository:
         """Reopen a closed account and return the updated row."""
         logger.info("Opening daily account id=%s", account_id)
         now = datetime.now(tz=timezone.utc).isoformat()
-        self._conn.execute(
+        return self._update_returning(
             """
             UPDATE daily_accounts
                SET is_closed = 0, closed_at = NULL, closed_by = NULL, updated_by = ?, updated_at = ?
              WHERE id = ?
             """,
             (opened_by, now, account_id),
+            account_id,
         )
-        return self.get_by_id(account_id)
 
     @log_db_timing
-    def update_totals(
+    def update_totals_and_close(
         self,
         account_id: int,
         subtotal: float,
@@ -163,20 +176,45 @@ class DailyAccountRepository:
         total: float,
         carts_count: int,
         items_count: int,
-        updated_by: int,
+        closed_by: int,
     ) -> Optional[DailyAccount]:
-        """Update daily account totals and return the updated row."""
-        logger.info("Updating daily account totals id=%s", account_id)
+        """Store recomputed totals, close the account and return the updated row."""
+        logger.info("Updating totals and closing daily account id=%s", account_id)
         now = datetime.now(tz=timezone.utc).isoformat()
-        self._conn.execute(
+        return self._update_returning(
             """
             UPDATE daily_accounts
                SET subtotal = ?, discount_total = ?, tax_total = ?, total = ?,
-                   carts_count = ?, items_count = ?, updated_by = ?, updated_at = ?
+                   carts_count = ?, items_count = ?,
+                   is_closed = 1, closed_at = ?, closed_by = ?,
+                   updated_by = ?, updated_at = ?
              WHERE id = ?
             """,
-            (subtotal, discount_total, tax_total, total, carts_count, items_count, updated_by, now, account_id),
+            (
+                subtotal,
+                discount_total,
+                tax_total,
+                total,
+                carts_count,
+                items_count,
+                now,
+                closed_by,
+                closed_by,
+                now,
+                account_id,
+            ),
+            account_id,
         )
+
+    def _update_returning(
+        self, sql: str, params: tuple, account_id: int
+    ) -> Optional[DailyAccount]:
+        """Run an UPDATE on one account and return the row it leaves behind."""
+        if SUPPORTS_RETURNING:
+            row = self._conn.execute(sql + " RETURNING *", params).fetchone()
+            return DailyAccount.from_row(row) if row else None
+
+        self._conn.execute(sql, params)
         return self.get_by_id(account_id)
 
     # ------------------------------------------------------------------
@@ -204,25 +242,17 @@ class DailyAccountRepository:
         return [DailyAccountItem.from_row(row) for row in rows]
 
     @log_db_timing
-    def create_item(
-        self,
-        account_id: int,
-        item_id: int,
-        item_name: str,
-        sku: Optional[str],
-        quantity: float,
-        unit_price: float,
-        discount_rate: float,
-        tax_rate: float,
-        line_subtotal: float,
-        line_discount: float,
-        line_tax: float,
-        line_total: float,
-    ) -> DailyAccountItem:
-        """Insert a daily account item row and return it."""
-        logger.info("Creating daily account item account_id=%s item_id=%s", account_id, item_id)
+    def create_items(self, account_id: int, items: list[dict]) -> int:
+        """
+        Insert all aggregated line items for an account with one executemany.
+
+        Each dict carries item_id, name, sku, quantity, unit_price,
+        discount_rate, tax_rate and the line_* amounts. Returns the number
+        of rows inserted.
+        """
+        logger.info("Creating %s daily account items account_id=%s", len(items), account_id)
         now = datetime.now(tz=timezone.utc).isoformat()
-        cursor = self._conn.execute(
+        cursor = self._conn.executemany(
             """
             INSERT INTO daily_account_items (
                 account_id, item_id, item_name, sku, quantity,
@@ -231,23 +261,26 @@ class DailyAccountRepository:
             )
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (
-                account_id,
-                item_id,
-                item_name,
-                sku,
-                quantity,
-                unit_price,
-                discount_rate,
-                tax_rate,
-                line_subtotal,
-                line_discount,
-                line_tax,
-                line_total,
-                now,
-            ),
+            [
+                (
+                    account_id,
+                    item["item_id"],
+                    item["name"],
+                    item["sku"],
+                    item["quantity"],
+                    item["unit_price"],
+                    item["discount_rate"],
+                    item["tax_rate"],
+                    item["line_subtotal"],
+                    item["line_discount"],
+                    item["line_tax"],
+                    item["line_total"],
+                    now,
+                )
+                for item in items
+            ],
         )
-        return self.get_item_by_id(cursor.lastrowid)  # type: ignore[return-value]
+        return cursor.rowcount
 
     @log_db_timing
     def delete_items_by_account(self, account_id: int) -> int:
@@ -287,7 +320,7 @@ class DailyAccountRepository:
             logger.trace("No sales data for item_id=%s", item_id)
             return {
                 "item_id": item_id,
-                "total_quantity": 0,
+                "total_quantity": 0.0,
                 "total_revenue": 0.0,
                 "days_sold": 0,
                 "avg_unit_price": 0.0,
@@ -8,6 +8,7 @@ Design rules enforced at DB level:
 """
 import sqlite3
 from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Optional
 import logging
 
@@ -164,13 +165,18 @@ class StockRepository:
     def adjust_quantity(
         self,
         item_id: int,
-        delta: float,
+        delta: Decimal | float,
         updated_by: int,
-    ) -> Optional[StockEntry]:
-        """Adjust the quantity for an existing stock entry by a delta."""
+    ) -> bool:
+        """
+        Adjust the quantity for an existing stock entry by a delta.
+
+        Returns True if a stock entry was updated. The row is not re-read;
+        callers that need the new quantity should fetch it explicitly.
+        """
         logger.info("Adjusting stock entry item_id=%s by delta=%s", item_id, delta)
         now = datetime.now(tz=timezone.utc).isoformat()
-        self._conn.execute(
+        cursor = self._conn.execute(
             """
             UPDATE stock_entries
                SET quantity = quantity + ?, updated_by = ?, updated_at = ?
@@ -178,7 +184,55 @@ class StockRepository:
             """,
             (delta, updated_by, now, item_id),
         )
-        return self.get_by_item_id(item_id)
+        return cursor.rowcount > 0
+
+    @log_db_timing
+    def try_reserve(
+        self,
+        item_id: int,
+        quantity: Decimal | float,
+        updated_by: int,
+    ) -> bool:
+        """
+        Take *quantity* out of stock only if at least that much is available.
+
+        Returns False, leaving stock untouched, when the entry is missing or
+        holds less than *quantity*.
+        """
+        logger.info("Reserving stock item_id=%s quantity=%s", item_id, quantity)
+        now = datetime.now(tz=timezone.utc).isoformat()
+        cursor = self._conn.execute(
+            """
+            UPDATE stock_entries
+               SET quantity = quantity - ?, updated_by = ?, updated_at = ?
+             WHERE item_id = ? AND quantity >= ?
+            """,
+            (quantity, updated_by, now, item_id, quantity),
+        )
+        return cursor.rowcount > 0
+
+    @log_db_timing
+    def adjust_quantities(
+        self,
+        deltas: list[tuple[int, Decimal | float]],
+        updated_by: int,
+    ) -> int:
+        """
+        Apply several (item_id, delta) stock adjustments in one executemany.
+
+        Returns the number of stock entries updated.
+        """
+        logger.info("Adjusting %s stock entries", len(deltas))
+        now = datetime.now(tz=timezone.utc).isoformat()
+        cursor = self._conn.executemany(
+            """
+            UPDATE stock_entries
+               SET quantity = quantity + ?, updated_by = ?, updated_at = ?
+             WHERE item_id = ?
+            """,
+            [(delta, updated_by, now, item_id) for item_id, delta in deltas],
+        )
+        return cursor.rowcount
 
     @log_db_timing
     def delete(self, item_id: int) -> bool:
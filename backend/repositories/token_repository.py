@@ -3,19 +3,28 @@ Repository layer for RefreshToken persistence.
 All SQL for the `refresh_tokens` table lives here.
 """
 import sqlite3
-from datetime import datetime, timezone
+import time
+from datetime import datetime
 from typing import Optional
 import logging
 
 from backend.models.token import RefreshToken
+from backend.models.user import User
 from backend.core.logging_config import log_db_timing
+from backend.db.database import SUPPORTS_RETURNING
 
 logger = logging.getLogger(__name__)
 
+# Column order expected by RefreshToken.from_tuple
+_TOKEN_COLUMNS = "id, user_id, token, expires_at, revoked, created_at, jti"
+
 
 class TokenRepository:
     """Data access layer for refresh token records."""
 
+    # Maximum rows removed per delete_expired_batch call
+    DELETE_BATCH_SIZE = 4096
+
     def __init__(self, conn: sqlite3.Connection) -> None:
         """Store the database connection for query execution."""
         logger.trace("Initializing TokenRepository")
@@ -28,26 +37,70 @@ class TokenRepository:
     @log_db_timing
     def get_by_token(self, token: str) -> Optional[RefreshToken]:
         """Return the refresh token row for the given token string."""
-        logger.trace("Fetching refresh token record")
-        row = self._conn.execute(
-            "SELECT * FROM refresh_tokens WHERE token = ?", (token,)
+        # Plain tuples skip sqlite3.Row's name lookups on this per-refresh path
+        cursor = self._conn.cursor()
+        cursor.row_factory = None
+        row = cursor.execute(
+            f"SELECT {_TOKEN_COLUMNS} FROM refresh_tokens WHERE token = ?", (token,)
+        ).fetchone()
+        return RefreshToken.from_tuple(row) if row else None
+
+    @log_db_timing
+    def get_by_jti_with_user(self, jti: str) -> Optional[tuple[RefreshToken, User]]:
+        """
+        Return the refresh token with the given jti and its owning user.
+
+        Both rows come back from one JOIN so a refresh needs a single query.
+        """
+        cursor = self._conn.cursor()
+        cursor.row_factory = None
+        row = cursor.execute(
+            """
+            SELECT t.id, t.user_id, t.token, t.expires_at, t.revoked, t.created_at, t.jti,
+                   u.id, u.email, u.username, u.full_name, u.hashed_password, u.role,
+                   u.is_active, u.is_deleted, u.deleted_at, u.created_at, u.updated_at
+              FROM refresh_tokens t
+              JOIN users u ON u.id = t.user_id
+             WHERE t.jti = ?
+            """,
+            (jti,),
         ).fetchone()
-        return RefreshToken.from_row(row) if row else None
+        if row is None:
+            return None
+        return RefreshToken.from_tuple(row[:7]), User.from_tuple(row[7:])
 
     # ------------------------------------------------------------------
     # Write
     # ------------------------------------------------------------------
 
     @log_db_timing
-    def create(self, user_id: int, token: str, expires_at: datetime) -> RefreshToken:
+    def create(
+        self,
+        user_id: int,
+        token: str,
+        expires_at: datetime,
+        jti: Optional[str] = None,
+    ) -> RefreshToken:
         """Insert a refresh token row and return it."""
         logger.info("Creating refresh token for user id=%s", user_id)
+        params = (user_id, token, int(expires_at.timestamp()), jti)
+        if SUPPORTS_RETURNING:
+            row = self._conn.execute(
+                """
+                INSERT INTO refresh_tokens (user_id, token, expires_at, jti)
+                VALUES (?, ?, ?, ?)
+                RETURNING *
+                """,
+                params,
+            ).fetchone()
+            return RefreshToken.from_row(row)
+
         cursor = self._conn.execute(
             """
-            INSERT INTO refresh_tokens (user_id, token, expires_at)
-            VALUES (?, ?, ?)
+            INSERT INTO refresh_tokens (user_id, token, expires_at, jti)
+            VALUES (?, ?, ?, ?)
             """,
-            (user_id, token, expires_at.isoformat()),
+            params,
         )
         row = self._conn.execute(
             "SELECT * FROM refresh_tokens WHERE id = ?", (cursor.lastrowid,)
@@ -77,11 +130,43 @@ class TokenRepository:
 
     @log_db_timing
     def delete_expired(self) -> int:
-        """Delete expired refresh tokens and return the count removed."""
-        now = datetime.now(tz=timezone.utc).isoformat()
+        """
+        Delete every expired refresh token and return the count removed.
+
+        Rows go in batches of DELETE_BATCH_SIZE inside the caller's
+        transaction; nothing is committed here. Maintenance jobs that want
+        the write lock released between batches should use
+        purge_expired_refresh_tokens() instead.
+        """
         logger.info("Deleting expired refresh tokens")
+        deleted = 0
+        while True:
+            count = self.delete_expired_batch()
+            deleted += count
+            if count < self.DELETE_BATCH_SIZE:
+                break
+        logger.info("Expired refresh tokens deleted=%s", deleted)
+        return deleted
+
+    @log_db_timing
+    def delete_expired_batch(self, limit: Optional[int] = None) -> int:
+        """
+        Delete up to *limit* expired refresh tokens and return the count removed.
+
+        *limit* defaults to DELETE_BATCH_SIZE; nothing is committed here.
+        """
+        if limit is None:
+            limit = self.DELETE_BATCH_SIZE
         cursor = self._conn.execute(
-            "DELETE FROM refresh_tokens WHERE expires_at < ?", (now,)
+            """
+            DELETE FROM refresh_tokens
+             WHERE rowid IN (
+                SELECT rowid FROM refresh_tokens
+                 WHERE expires_at < ?
+                 LIMIT ?
+             )
+            """,
+            (int(time.time()), limit),
         )
-        logger.info("Expired refresh tokens deleted=%s", cursor.rowcount)
+        logger.trace("Expired refresh token batch deleted=%s", cursor.rowcount)
         return cursor.rowcount
@@ -9,13 +9,28 @@ import logging
 
 from backend.models.user import User, UserRole
 from backend.core.logging_config import log_db_timing
+from backend.db.database import SUPPORTS_RETURNING
 
 logger = logging.getLogger(__name__)
 
+# Column order expected by User.from_tuple
+_USER_COLUMNS = (
+    "id, email, username, full_name, hashed_password, role, "
+    "is_active, is_deleted, deleted_at, created_at, updated_at"
+)
+
 
 class UserRepository:
     """Data access layer for user records."""
 
+    # Columns update() may set; names are interpolated into the SET clause
+    UPDATABLE_COLUMNS = frozenset(
+        {"email", "username", "full_name", "hashed_password", "role", "is_active"}
+    )
+
+    # UPDATE statements keyed by the ordered tuple of columns being set
+    _update_sql_cache: dict[tuple[str, ...], str] = {}
+
     def __init__(self, conn: sqlite3.Connection) -> None:
         """Store the database connection for query execution."""
         logger.trace("Initializing UserRepository")
@@ -28,16 +43,17 @@ class UserRepository:
     @log_db_timing
     def get_by_id(self, user_id: int) -> Optional[User]:
         """Return a user by id or None if missing."""
-        logger.trace("Fetching user by id=%s", user_id)
-        row = self._conn.execute(
-            "SELECT * FROM users WHERE id = ?", (user_id,)
+        # Plain tuples skip sqlite3.Row's name lookups on this per-request path
+        cursor = self._conn.cursor()
+        cursor.row_factory = None
+        row = cursor.execute(
+            f"SELECT {_USER_COLUMNS} FROM users WHERE id = ?", (user_id,)
         ).fetchone()
-        return User.from_row(row) if row else None
+        return User.from_tuple(row) if row else None
 
     @log_db_timing
     def get_active_by_id(self, user_id: int) -> Optional[User]:
         """Return a user only if they are not soft-deleted."""
-        logger.trace("Fetching active user by id=%s", user_id)
         row = self._conn.execute(
             "SELECT * FROM users WHERE id = ? AND is_deleted = 0", (user_id,)
         ).fetchone()
@@ -46,7 +62,6 @@ class UserRepository:
     @log_db_timing
     def get_by_email(self, email: str) -> Optional[User]:
         """Return a non-deleted user by email."""
-        logger.trace("Fetching user by email=%s", email)
         row = self._conn.execute(
             "SELECT * FROM users WHERE email = ? AND is_deleted = 0", (email,)
         ).fetchone()
@@ -55,23 +70,55 @@ class UserRepository:
     @log_db_timing
     def get_by_username(self, username: str) -> Optional[User]:
         """Return a non-deleted user by username."""
-        logger.trace("Fetching user by username=%s", username)
         row = self._conn.execute(
             "SELECT * FROM users WHERE username = ? AND is_deleted = 0", (username,)
         ).fetchone()
         return User.from_row(row) if row else None
 
     @log_db_timing
-    def list_all(self, include_deleted: bool = False) -> list[User]:
-        """Return users, optionally including soft-deleted accounts."""
-        logger.trace("Listing users include_deleted=%s", include_deleted)
-        if include_deleted:
-            rows = self._conn.execute("SELECT * FROM users").fetchall()
-        else:
-            rows = self._conn.execute(
-                "SELECT * FROM users WHERE is_deleted = 0"
-            ).fetchall()
-        return [User.from_row(r) for r in rows]
+    def list_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        include_deleted: bool = False,
+        role: Optional[UserRole] = None,
+    ) -> list[User]:
+        """Return a page of users ordered by id, optionally filtered."""
+        logger.trace(
+            "Listing users limit=%s offset=%s include_deleted=%s role=%s",
+            limit, offset, include_deleted, role,
+        )
+        where, params = self._list_filters(include_deleted, role)
+        rows = self._conn.execute(
+            f"SELECT * FROM users{where} ORDER BY id LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        ).fetchall()
+        return User.from_rows(rows)
+
+    @log_db_timing
+    def count_all(
+        self, include_deleted: bool = False, role: Optional[UserRole] = None
+    ) -> int:
+        """Return the number of users matching the list_all filters."""
+        where, params = self._list_filters(include_deleted, role)
+        return self._conn.execute(
+            f"SELECT COUNT(*) FROM users{where}", params
+        ).fetchone()[0]
+
+    @staticmethod
+    def _list_filters(
+        include_deleted: bool, role: Optional[UserRole]
+    ) -> tuple[str, tuple]:
+        """Build the WHERE clause shared by list_all and count_all."""
+        clauses: list[str] = []
+        params: list = []
+        if not include_deleted:
+            clauses.append("is_deleted = 0")
+        if role is not None:
+            clauses.append("role = ?")
+            params.append(role.value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, tuple(params)
 
     # ------------------------------------------------------------------
     # Write
@@ -83,36 +130,72 @@ class UserRepository:
         email: str,
         username: str,
         hashed_password: str,
-        role: UserRole,
+        role: UserRole | str,
         full_name: Optional[str] = None,
     ) -> User:
         """Insert a new user row and return the created user."""
         logger.info("Creating user record username=%s", username)
+        role_value = role.value if isinstance(role, UserRole) else role
+        params = (email, username, full_name, hashed_password, role_value)
+        if SUPPORTS_RETURNING:
+            row = self._conn.execute(
+                """
+                INSERT INTO users (email, username, full_name, hashed_password, role)
+                VALUES (?, ?, ?, ?, ?)
+                RETURNING *
+                """,
+                params,
+            ).fetchone()
+            return User.from_row(row)
+
         cursor = self._conn.execute(
             """
             INSERT INTO users (email, username, full_name, hashed_password, role)
             VALUES (?, ?, ?, ?, ?)
             """,
-            (email, username, full_name, hashed_password, role.value),
+            params,
         )
         return self.get_by_id(cursor.lastrowid)  # type: ignore[return-value]
 
     @log_db_timing
     def update(self, user_id: int, **fields) -> Optional[User]:
-        """Update user fields and return the updated row."""
+        """
+        Update user fields and return the updated row.
+
+        Only UPDATABLE_COLUMNS may be passed; anything else raises ValueError
+        before the SET clause is built.
+        """
         if not fields:
             logger.trace("No user fields to update id=%s", user_id)
             return self.get_by_id(user_id)
 
+        columns = tuple(fields)
+        sql = self._update_sql_cache.get(columns)
+        if sql is None:
+            sql = self._build_update_sql(columns)
+
         logger.info("Updating user record id=%s", user_id)
-        fields["updated_at"] = datetime.now(tz=timezone.utc).isoformat()
-        set_clause = ", ".join(f"{col} = ?" for col in fields)
-        values = list(fields.values()) + [user_id]
-        self._conn.execute(
-            f"UPDATE users SET {set_clause} WHERE id = ?", values
-        )
+        values = [*fields.values(), datetime.now(tz=timezone.utc).isoformat(), user_id]
+        if SUPPORTS_RETURNING:
+            row = self._conn.execute(sql, values).fetchone()
+            return User.from_row(row) if row else None
+
+        self._conn.execute(sql, values)
         return self.get_by_id(user_id)
 
+    @classmethod
+    def _build_update_sql(cls, columns: tuple[str, ...]) -> str:
+        """Validate an update shape and cache the UPDATE statement for it."""
+        unknown = set(columns) - cls.UPDATABLE_COLUMNS
+        if unknown:
+            raise ValueError(f"Cannot update user columns: {sorted(unknown)}")
+
+        set_clause = ", ".join(f"{col} = ?" for col in (*columns, "updated_at"))
+        sql = f"UPDATE users SET {set_clause} WHERE id = ?"
+        if SUPPORTS_RETURNING:
+            sql += " RETURNING *"
+        return cls._update_sql_cache.setdefault(columns, sql)
+
     @log_db_timing
     def soft_delete(self, user_id: int) -> bool:
         """
@@ -134,3 +217,21 @@ class UserRepository:
         )
         logger.info("Soft delete affected %s rows", cursor.rowcount)
         return cursor.rowcount > 0
+
+    @log_db_timing
+    def soft_delete_and_revoke(self, user_id: int) -> bool:
+        """
+        Soft-delete the user and revoke their active refresh tokens.
+
+        Both UPDATEs run on this connection's open transaction, so they are
+        committed (or rolled back) together by get_db with a single commit.
+        Tokens are only revoked when the soft delete matched a row.
+        """
+        if not self.soft_delete(user_id):
+            return False
+        cursor = self._conn.execute(
+            "UPDATE refresh_tokens SET revoked = 1 WHERE user_id = ? AND revoked = 0",
+            (user_id,),
+        )
+        logger.info("Refresh tokens revoked for deleted user count=%s", cursor.rowcount)
+        return True
@@ -3,12 +3,17 @@ Pydantic schemas for Cart request/response validation.
 """
 from datetime import datetime
 from decimal import Decimal
-import logging
 from enum import Enum
+from typing import Annotated
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, BeforeValidator, Field, TypeAdapter
 
-logger = logging.getLogger(__name__)
+from backend.models.cart import Cart
+from backend.utils.money import float_to_decimal
+
+
+# Decimal, str and int inputs are left to pydantic-core's native Decimal parsing
+QuantityDecimal = Annotated[Decimal, BeforeValidator(float_to_decimal)]
 
 
 class CartStatus(str, Enum):
@@ -50,47 +55,23 @@ class CartItemCreate(BaseModel):
     """Payload for adding items to a cart."""
 
     item_id: int = Field(..., gt=0, description="ID of the item to add")
-    quantity: Decimal = Field(..., gt=0, decimal_places=3)
-
-    @field_validator("quantity", mode="before")
-    @classmethod
-    def coerce_decimal(cls, v):
-        """Coerce numeric inputs into Decimal values."""
-        logger.trace("Coercing cart decimal value")
-        return Decimal(str(v)) if v is not None else v
-
+    quantity: QuantityDecimal = Field(..., gt=0, decimal_places=3)
 
 class CartItemUpdate(BaseModel):
     """Payload for updating quantities on cart items."""
 
-    quantity: Decimal = Field(..., ge=0, decimal_places=3)
-
-    @field_validator("quantity", mode="before")
-    @classmethod
-    def coerce_decimal(cls, v):
-        """Coerce numeric inputs into Decimal values."""
-        logger.trace("Coercing cart decimal value")
-        return Decimal(str(v)) if v is not None else v
-
+    quantity: QuantityDecimal = Field(..., ge=0, decimal_places=3)
 
 class CartItemReturn(BaseModel):
     """Payload for returning items from a cart (partial or full return)."""
 
-    quantity: Decimal | None = Field(
+    quantity: QuantityDecimal | None = Field(
         None,
         gt=0,
         decimal_places=3,
         description="Quantity to return. If not provided, full quantity is returned.",
     )
 
-    @field_validator("quantity", mode="before")
-    @classmethod
-    def coerce_decimal(cls, v):
-        """Coerce numeric inputs into Decimal values."""
-        logger.trace("Coercing cart decimal value")
-        return Decimal(str(v)) if v is not None else v
-
-
 # ---------------------------------------------------------------------------
 # Response schemas
 # ---------------------------------------------------------------------------
@@ -111,6 +92,34 @@ class CartItemTotals(BaseModel):
     line_tax: Decimal
     line_total: Decimal
 
+    # Instances are shared through the service's totals cache
+    model_config = {"frozen": True}
+
+    @classmethod
+    def from_line(
+        cls,
+        line: dict,
+        line_subtotal: Decimal,
+        line_discount: Decimal,
+        line_tax: Decimal,
+        line_total: Decimal,
+    ) -> "CartItemTotals":
+        """Build the line from a trusted repository cart line without re-validating."""
+        return cls.model_construct(
+            id=line["id"],
+            item_id=line["item_id"],
+            name=line["name"],
+            sku=line["sku"],
+            unit_price=line["unit_price"],
+            quantity=line["quantity"],
+            discount_rate=line["discount_rate"],
+            tax_rate=line["tax_rate"],
+            line_subtotal=line_subtotal,
+            line_discount=line_discount,
+            line_tax=line_tax,
+            line_total=line_total,
+        )
+
 
 class CartTotals(BaseModel):
     """Aggregate totals for a cart."""
@@ -150,9 +159,39 @@ class CartResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class CartListEntryResponse(CartResponse):
+    """Cart metadata with its line count and total, for cart listings."""
+
+    item_count: int
+    total: Decimal
+
+    @classmethod
+    def from_model(cls, cart: Cart, item_count: int, total: Decimal) -> "CartListEntryResponse":
+        """Build the response from a trusted domain model without re-validating."""
+        return cls.model_construct(
+            id=cart.id,
+            desk_number=cart.desk_number,
+            # The domain model has its own CartStatus enum
+            status=CartStatus(cart.status.value),
+            created_by=cart.created_by,
+            updated_by=cart.updated_by,
+            created_at=cart.created_at,
+            updated_at=cart.updated_at,
+            item_count=item_count,
+            total=total,
+        )
+
+
 class CartSummaryResponse(BaseModel):
     """Response model that bundles cart items and totals."""
 
     cart: CartResponse
     items: list[CartItemTotals]
     totals: CartTotals
+
+
+# ---------------------------------------------------------------------------
+# Adapters (built once at import and reused for every list)
+# ---------------------------------------------------------------------------
+
+CART_LIST_ENTRY_LIST = TypeAdapter(list[CartListEntryResponse])
@@ -1,10 +1,12 @@
 """
 Pydantic schemas for Category request/response validation.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime
 from typing import Optional
 
+from backend.models.category import Category
+
 
 # ---------------------------------------------------------------------------
 # Request schemas
@@ -41,4 +43,25 @@ class CategoryResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+    @classmethod
+    def from_model(cls, category: Category) -> "CategoryResponse":
+        """Build the response from a trusted domain model without re-validating."""
+        return cls.model_construct(
+            id=category.id,
+            name=category.name,
+            description=category.description,
+            sort_order=category.sort_order,
+            created_by=category.created_by,
+            updated_by=category.updated_by,
+            created_at=category.created_at,
+            updated_at=category.updated_at,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Adapters (built once at import and reused for every list)
+# ---------------------------------------------------------------------------
+
+CATEGORY_RESPONSE_LIST = TypeAdapter(list[CategoryResponse])
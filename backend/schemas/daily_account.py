@@ -5,7 +5,10 @@ from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+
+from backend.models.daily_account import DailyAccount
+from backend.models.daily_account_item import DailyAccountItem
 
 
 # ---------------------------------------------------------------------------
@@ -30,7 +33,27 @@ class DailyAccountItemResponse(BaseModel):
     line_total: Decimal
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "ignore"}
+
+    @classmethod
+    def from_model(cls, item: DailyAccountItem) -> "DailyAccountItemResponse":
+        """Build the response from a trusted domain model without re-validating."""
+        return cls.model_construct(
+            id=item.id,
+            account_id=item.account_id,
+            item_id=item.item_id,
+            item_name=item.item_name,
+            sku=item.sku,
+            quantity=item.quantity,
+            unit_price=item.unit_price,
+            discount_rate=item.discount_rate,
+            tax_rate=item.tax_rate,
+            line_subtotal=item.line_subtotal,
+            line_discount=item.line_discount,
+            line_tax=item.line_tax,
+            line_total=item.line_total,
+            created_at=item.created_at,
+        )
 
 
 class DailyAccountTotals(BaseModel):
@@ -41,6 +64,8 @@ class DailyAccountTotals(BaseModel):
     tax_total: Decimal
     total: Decimal
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
 
 class DailyAccountResponse(BaseModel):
     """Response model for daily-account summary metadata."""
@@ -61,7 +86,28 @@ class DailyAccountResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "ignore"}
+
+    @classmethod
+    def from_model(cls, account: DailyAccount) -> "DailyAccountResponse":
+        """Build the response from a trusted domain model without re-validating."""
+        return cls.model_construct(
+            id=account.id,
+            account_date=account.account_date,
+            subtotal=account.subtotal,
+            discount_total=account.discount_total,
+            tax_total=account.tax_total,
+            total=account.total,
+            carts_count=account.carts_count,
+            items_count=account.items_count,
+            is_closed=account.is_closed,
+            closed_at=account.closed_at,
+            closed_by=account.closed_by,
+            created_by=account.created_by,
+            updated_by=account.updated_by,
+            created_at=account.created_at,
+            updated_at=account.updated_at,
+        )
 
 
 class DailyAccountSummaryResponse(BaseModel):
@@ -75,6 +121,9 @@ class DailyAccountSummaryResponse(BaseModel):
 # ---------------------------------------------------------------------------
 # Analysis Response schemas
 # ---------------------------------------------------------------------------
+# Field types mirror what the repository aggregates already produce (SQLite
+# REAL sums/averages are floats, counts are ints), so these models can be
+# built with model_construct and serialized without per-field coercion.
 
 class ItemSalesResponse(BaseModel):
     """Response payload for item sales analytics."""
@@ -105,3 +154,13 @@ class CategorySalesResponse(BaseModel):
     total_quantity: float
     total_revenue: float
     items_count: int
+
+
+# ---------------------------------------------------------------------------
+# Adapters (built once at import and reused for every list)
+# ---------------------------------------------------------------------------
+
+DAILY_ACCOUNT_RESPONSE_LIST = TypeAdapter(list[DailyAccountResponse])
+TOP_SELLER_LIST = TypeAdapter(list[TopSellerResponse])
+CATEGORY_SALES_LIST = TypeAdapter(list[CategorySalesResponse])
+DAILY_ACCOUNT_SUMMARY = TypeAdapter(DailyAccountSummaryResponse)
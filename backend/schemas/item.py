@@ -1,13 +1,21 @@
 """
 Pydantic schemas for Item request/response validation.
 """
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, BeforeValidator, Field, TypeAdapter
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
-import logging
+from typing import Annotated, Optional
 
-logger = logging.getLogger(__name__)
+from backend.models.item import Item
+from backend.utils.money import float_to_decimal
+
+
+# Decimal, str and int inputs are left to pydantic-core's native Decimal parsing
+PriceDecimal = Annotated[Decimal, BeforeValidator(float_to_decimal)]
+
+# Bounds and defaults as ready-made Decimals so constraints compare like types
+_D0 = Decimal(0)
+_D100 = Decimal(100)
 
 
 # ---------------------------------------------------------------------------
@@ -23,19 +31,12 @@ class ItemCreate(BaseModel):
     sku: Optional[str] = Field(None, min_length=1, max_length=50)
     barcode: Optional[str] = Field(None, max_length=50)
     image_url: Optional[str] = Field(None, max_length=500)
-    unit_price: Decimal = Field(..., ge=0, decimal_places=2)
+    unit_price: PriceDecimal = Field(..., ge=_D0, decimal_places=2)
     unit_type: str = Field(default="piece", max_length=20)
-    tax_rate: Decimal = Field(default=0, ge=0, le=100, decimal_places=2)
-    discount_rate: Decimal = Field(default=0, ge=0, le=100, decimal_places=2)
+    tax_rate: PriceDecimal = Field(default=_D0, ge=_D0, le=_D100, decimal_places=2)
+    discount_rate: PriceDecimal = Field(default=_D0, ge=_D0, le=_D100, decimal_places=2)
 
-    @field_validator("unit_price", "tax_rate", "discount_rate", mode="before")
-    @classmethod
-    def validate_decimal(cls, v):
-        """Normalize decimal inputs to Decimal instances."""
-        logger.trace("Validating item decimal value")
-        if v is None:
-            return v
-        return Decimal(str(v))
+    model_config = {"extra": "forbid"}
 
 
 class ItemUpdate(BaseModel):
@@ -47,19 +48,12 @@ class ItemUpdate(BaseModel):
     sku: Optional[str] = Field(None, min_length=1, max_length=50)
     barcode: Optional[str] = Field(None, max_length=50)
     image_url: Optional[str] = Field(None, max_length=500)
-    unit_price: Optional[Decimal] = Field(None, ge=0, decimal_places=2)
+    unit_price: Optional[PriceDecimal] = Field(None, ge=_D0, decimal_places=2)
     unit_type: Optional[str] = Field(None, max_length=20)
-    tax_rate: Optional[Decimal] = Field(None, ge=0, le=100, decimal_places=2)
-    discount_rate: Optional[Decimal] = Field(None, ge=0, le=100, decimal_places=2)
+    tax_rate: Optional[PriceDecimal] = Field(None, ge=_D0, le=_D100, decimal_places=2)
+    discount_rate: Optional[PriceDecimal] = Field(None, ge=_D0, le=_D100, decimal_places=2)
 
-    @field_validator("unit_price", "tax_rate", "discount_rate", mode="before")
-    @classmethod
-    def validate_decimal(cls, v):
-        """Normalize decimal inputs to Decimal instances."""
-        logger.trace("Validating item decimal value")
-        if v is None:
-            return v
-        return Decimal(str(v))
+    model_config = {"extra": "forbid"}
 
 
 # ---------------------------------------------------------------------------
@@ -85,4 +79,32 @@ class ItemResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True, "frozen": True, "extra": "ignore"}
+
+    @classmethod
+    def from_model(cls, item: Item) -> "ItemResponse":
+        """Build the response from a trusted domain model without re-validating."""
+        return cls.model_construct(
+            id=item.id,
+            category_id=item.category_id,
+            name=item.name,
+            description=item.description,
+            sku=item.sku,
+            barcode=item.barcode,
+            image_url=item.image_url,
+            unit_price=item.unit_price,
+            unit_type=item.unit_type,
+            tax_rate=item.tax_rate,
+            discount_rate=item.discount_rate,
+            created_by=item.created_by,
+            updated_by=item.updated_by,
+            created_at=item.created_at,
+            updated_at=item.updated_at,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Adapters (built once at import and reused for every list)
+# ---------------------------------------------------------------------------
+
+ITEM_RESPONSE_LIST = TypeAdapter(list[ItemResponse])
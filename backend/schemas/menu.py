@@ -5,7 +5,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 # ---------------------------------------------------------------------------
@@ -20,6 +20,8 @@ class MenuItemCreate(BaseModel):
     description: Optional[str] = Field(None, max_length=2000)
     allergens: Optional[str] = Field(None, max_length=500)
 
+    model_config = {"extra": "forbid"}
+
 
 # ---------------------------------------------------------------------------
 # Response schemas
@@ -37,7 +39,7 @@ class MenuItemResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "ignore"}
 
 
 class MenuItemPublic(BaseModel):
@@ -50,6 +52,8 @@ class MenuItemPublic(BaseModel):
     allergens: Optional[str]
     discount_rate: Decimal
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
 
 class MenuCategoryGroupPublic(BaseModel):
     """Grouped menu items for public display."""
@@ -58,3 +62,13 @@ class MenuCategoryGroupPublic(BaseModel):
     category_name: str
     sort_order: int
     items: list[MenuItemPublic]
+
+    model_config = {"frozen": True, "extra": "ignore"}
+
+
+# ---------------------------------------------------------------------------
+# Adapters (built once at import and reused for every list)
+# ---------------------------------------------------------------------------
+
+MENU_ITEM_PUBLIC_LIST = TypeAdapter(list[MenuItemPublic])
+MENU_CATEGORY_GROUP_PUBLIC_LIST = TypeAdapter(list[MenuCategoryGroupPublic])
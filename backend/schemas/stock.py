@@ -3,12 +3,16 @@ Pydantic schemas for StockEntry request/response validation.
 """
 from decimal import Decimal
 from datetime import datetime
-from typing import Optional
-import logging
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, BeforeValidator, Field, TypeAdapter
 
-logger = logging.getLogger(__name__)
+from backend.models.stock import StockEntry
+from backend.utils.money import float_to_decimal
+
+
+# Decimal, str and int inputs are left to pydantic-core's native Decimal parsing
+QuantityDecimal = Annotated[Decimal, BeforeValidator(float_to_decimal)]
 
 
 # ---------------------------------------------------------------------------
@@ -21,31 +25,21 @@ class StockCreate(BaseModel):
     item_id: int = Field(
         ..., gt=0, description="ID of the item to add to stock"
     )
-    quantity: Decimal = Field(
+    quantity: QuantityDecimal = Field(
         ..., ge=0, decimal_places=3, description="Initial quantity on hand"
     )
 
-    @field_validator("quantity", mode="before")
-    @classmethod
-    def coerce_decimal(cls, v):
-        """Coerce numeric inputs into Decimal values."""
-        logger.trace("Coercing stock decimal value")
-        return Decimal(str(v)) if v is not None else v
+    model_config = {"extra": "forbid"}
 
 
 class StockUpdate(BaseModel):
     """Payload for updating stock quantities."""
 
-    quantity: Decimal = Field(
+    quantity: QuantityDecimal = Field(
         ..., ge=0, decimal_places=3, description="New quantity on hand"
     )
 
-    @field_validator("quantity", mode="before")
-    @classmethod
-    def coerce_decimal(cls, v):
-        """Coerce numeric inputs into Decimal values."""
-        logger.trace("Coercing stock decimal value")
-        return Decimal(str(v)) if v is not None else v
+    model_config = {"extra": "forbid"}
 
 
 # ---------------------------------------------------------------------------
@@ -63,7 +57,20 @@ class StockEntryResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "ignore"}
+
+    @classmethod
+    def from_model(cls, entry: StockEntry) -> "StockEntryResponse":
+        """Build the response from a trusted domain model without re-validating."""
+        return cls.model_construct(
+            id=entry.id,
+            item_id=entry.item_id,
+            quantity=entry.quantity,
+            created_by=entry.created_by,
+            updated_by=entry.updated_by,
+            created_at=entry.created_at,
+            updated_at=entry.updated_at,
+        )
 
 
 class StockItemSummary(BaseModel):
@@ -77,6 +84,8 @@ class StockItemSummary(BaseModel):
     unit_price: float
     quantity: float
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
 
 class StockCategoryGroup(BaseModel):
     """One category bucket returned by the grouped stock endpoint."""
@@ -84,3 +93,13 @@ class StockCategoryGroup(BaseModel):
     category_id: int
     category_name: str
     items: list[StockItemSummary]
+
+    model_config = {"frozen": True, "extra": "ignore"}
+
+
+# ---------------------------------------------------------------------------
+# Adapters (built once at import and reused for every list)
+# ---------------------------------------------------------------------------
+
+STOCK_CATEGORY_GROUP_LIST = TypeAdapter(list[StockCategoryGroup])
+STOCK_ENTRY_RESPONSE_LIST = TypeAdapter(list[StockEntryResponse])
@@ -6,9 +6,9 @@ from decimal import Decimal
 from typing import Optional
 import logging
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
 
-from backend.models.time_entry import TimeEntryStatus
+from backend.models.time_entry import TimeEntry, TimeEntryStatus
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +26,8 @@ class TimeEntryCreate(BaseModel):
     end_hour: time = Field(..., description="End time of the work shift (e.g., '17:00')")
     notes: Optional[str] = Field(None, max_length=500, description="Optional notes about the work")
 
+    model_config = {"extra": "forbid"}
+
 
 class TimeEntryUpdate(BaseModel):
     """Payload for updating time entries."""
@@ -36,6 +38,8 @@ class TimeEntryUpdate(BaseModel):
     end_hour: Optional[time] = Field(None, description="End time of the work shift")
     notes: Optional[str] = Field(None, max_length=500, description="Optional notes about the work")
 
+    model_config = {"extra": "forbid"}
+
 
 class TimeEntryReview(BaseModel):
     """Payload for reviewing time entries."""
@@ -47,16 +51,14 @@ class TimeEntryReview(BaseModel):
         description="Required if status is 'rejected'. Reason for rejection."
     )
 
-    @field_validator("rejection_reason")
-    @classmethod
-    def require_rejection_reason(cls, v, info):
+    @model_validator(mode="after")
+    def require_rejection_reason(self) -> "TimeEntryReview":
         """Require a rejection reason when rejecting entries."""
-        logger.trace("Validating rejection reason")
-        if "status" in info.data and info.data["status"] == TimeEntryStatus.REJECTED:
-            if not v or not v.strip():
+        if self.status == TimeEntryStatus.REJECTED:
+            if not self.rejection_reason or not self.rejection_reason.strip():
                 logger.warning("Missing rejection reason")
                 raise ValueError("Rejection reason is required when rejecting a time entry")
-        return v
+        return self
 
 
 # ---------------------------------------------------------------------------
@@ -83,7 +85,29 @@ class TimeEntryResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "ignore"}
+
+    @classmethod
+    def from_model(cls, entry: TimeEntry) -> "TimeEntryResponse":
+        """Build the response from a trusted domain model without re-validating."""
+        return cls.model_construct(
+            id=entry.id,
+            employee_id=entry.employee_id,
+            work_date=entry.work_date,
+            end_date=entry.end_date,
+            start_hour=entry.start_hour,
+            end_hour=entry.end_hour,
+            hours_worked=entry.hours_worked,
+            notes=entry.notes,
+            status=entry.status,
+            reviewed_by=entry.reviewed_by,
+            reviewed_at=entry.reviewed_at,
+            rejection_reason=entry.rejection_reason,
+            created_by=entry.created_by,
+            updated_by=entry.updated_by,
+            created_at=entry.created_at,
+            updated_at=entry.updated_at,
+        )
 
 
 class EmployeeTimeEntries(BaseModel):
@@ -102,3 +126,10 @@ class GroupedTimeEntriesResponse(BaseModel):
     employees: list[EmployeeTimeEntries]
     total_hours: Decimal
     total_entries: int
+
+
+# ---------------------------------------------------------------------------
+# Adapters (built once at import and reused for every list)
+# ---------------------------------------------------------------------------
+
+TIME_ENTRY_RESPONSE_LIST = TypeAdapter(list[TimeEntryResponse])
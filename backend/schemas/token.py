@@ -1,7 +1,7 @@
 """
 Pydantic schemas for token request/response validation.
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing import Optional
 
 
@@ -11,12 +11,16 @@ class Token(BaseModel):
     refresh_token: str
     token_type: str = "bearer"
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
 
 class AccessToken(BaseModel):
     """Response schema for access-token-only responses."""
     access_token: str
     token_type: str = "bearer"
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
 
 class TokenPayload(BaseModel):
     """JWT payload (claims) decoded from a token."""
@@ -25,7 +29,17 @@ class TokenPayload(BaseModel):
     role: Optional[str] = None
     type: Optional[str] = None  # "access" | "refresh"
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
 
 class RefreshTokenRequest(BaseModel):
     """Request body for the /auth/refresh endpoint."""
     refresh_token: str
+
+
+# ---------------------------------------------------------------------------
+# Adapters (built once at import and reused for every response)
+# ---------------------------------------------------------------------------
+
+TOKEN_ADAPTER = TypeAdapter(Token)
+ACCESS_TOKEN_ADAPTER = TypeAdapter(AccessToken)
@@ -1,15 +1,42 @@
 """
 Pydantic schemas for User request/response validation.
 """
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import AfterValidator, BaseModel, Field, TypeAdapter, field_validator
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 import logging
+import re
 
-from backend.models.user import UserRole
+from backend.models.user import User, UserRole
 
 logger = logging.getLogger(__name__)
 
+# Structural check only; uniqueness is enforced by the users table
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _check_email(v: str) -> str:
+    """Reject values that are not shaped like an email address."""
+    if not _EMAIL_RE.match(v):
+        raise ValueError("invalid email")
+    return v
+
+
+_USERNAME_RE = re.compile(r"[A-Za-z0-9_]+")
+
+
+def _check_username(v: str) -> str:
+    """Allow only ASCII letters, digits and underscores."""
+    if not _USERNAME_RE.fullmatch(v):
+        raise ValueError("invalid username")
+    return v
+
+
+Email = Annotated[str, AfterValidator(_check_email)]
+Username = Annotated[
+    str, Field(min_length=3, max_length=50), AfterValidator(_check_username)
+]
+
 
 # ---------------------------------------------------------------------------
 # Request schemas
@@ -18,23 +45,33 @@ logger = logging.getLogger(__name__)
 class UserCreate(BaseModel):
     """Payload for user registration requests."""
 
-    email: EmailStr
-    username: str = Field(
-        ..., min_length=3, max_length=50, pattern=r"^[a-zA-Z0-9_]+$"
-    )
+    email: Email
+    username: Username
     full_name: Optional[str] = Field(None, max_length=100)
     password: str = Field(..., min_length=8, max_length=128)
     role: UserRole = UserRole.EMPLOYEE
 
+    model_config = {"extra": "forbid"}
+
     @field_validator("password")
     @classmethod
     def password_strength(cls, v: str) -> str:
         """Enforce the minimum password strength rules."""
-        logger.trace("Validating password strength")
-        if not any(c.isupper() for c in v):
+        # One pass over the password, stopping once both classes are seen
+        has_upper = has_digit = False
+        for c in v:
+            if c.isupper():
+                has_upper = True
+            elif c.isdigit():
+                has_digit = True
+            else:
+                continue
+            if has_upper and has_digit:
+                break
+        if not has_upper:
             logger.warning("Password missing uppercase letter")
             raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.isdigit() for c in v):
+        if not has_digit:
             logger.warning("Password missing digit")
             raise ValueError("Password must contain at least one digit")
         return v
@@ -43,12 +80,14 @@ class UserCreate(BaseModel):
 class UserUpdate(BaseModel):
     """Payload for updating user fields."""
 
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     full_name: Optional[str] = Field(None, max_length=100)
     password: Optional[str] = Field(None, min_length=8, max_length=128)
     role: Optional[UserRole] = None
     is_active: Optional[bool] = None
 
+    model_config = {"extra": "forbid"}
+
 
 # ---------------------------------------------------------------------------
 # Response schemas
@@ -68,4 +107,27 @@ class UserResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "ignore"}
+
+    @classmethod
+    def from_model(cls, user: User) -> "UserResponse":
+        """Build the response from a trusted domain model without re-validating."""
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            role=user.role,
+            is_active=user.is_active,
+            is_deleted=user.is_deleted,
+            deleted_at=user.deleted_at,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Adapters (built once at import and reused for every list)
+# ---------------------------------------------------------------------------
+
+USER_RESPONSE_LIST = TypeAdapter(list[UserResponse])
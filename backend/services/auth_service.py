@@ -2,6 +2,8 @@
 Authentication service: orchestrates login, token refresh, and logout logic.
 """
 import sqlite3
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
 import logging
 
@@ -18,11 +20,19 @@ from backend.core.security import (
 from backend.models.user import User
 from backend.repositories.user_repository import UserRepository
 from backend.repositories.token_repository import TokenRepository
-from backend.schemas.token import Token, AccessToken
+from backend.schemas.token import Token, AccessToken, TokenPayload
 
 logger = logging.getLogger(__name__)
 
 
+def _invalid_refresh_token() -> HTTPException:
+    """Build the 401 raised for any rejected refresh token."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired refresh token",
+    )
+
+
 class AuthService:
     """Business logic for authentication and token lifecycle."""
 
@@ -68,43 +78,61 @@ class AuthService:
 
     def refresh(self, refresh_token_str: str) -> AccessToken:
         """Validate a refresh token and issue a new access token."""
-        invalid_exc = HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired refresh token",
-        )
-
         # 1. Verify JWT signature & expiry
         try:
             payload = decode_token(refresh_token_str)
         except JWTError:
             logger.warning("Refresh token decode failed")
-            raise invalid_exc
+            raise _invalid_refresh_token()
 
         if payload.get("type") != "refresh":
             logger.warning("Refresh token type mismatch")
-            raise invalid_exc
+            raise _invalid_refresh_token()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # Claims are already signature-verified, so skip validation
+            logger.debug(
+                "Refresh token claims: %r",
+                TokenPayload.model_construct(
+                    sub=payload.get("sub"),
+                    role=payload.get("role"),
+                    type=payload.get("type"),
+                ),
+            )
+
+        # 2. Load the stored token and its user. Tokens carrying a jti are
+        #    resolved with one JOIN; older tokens fall back to two lookups.
+        jti = payload.get("jti")
+        if jti:
+            found = self._token_repo.get_by_jti_with_user(jti)
+            stored, user = found if found else (None, None)
+            if stored is not None and stored.token != refresh_token_str:
+                logger.warning("Refresh token does not match stored jti")
+                raise _invalid_refresh_token()
+        else:
+            stored = self._token_repo.get_by_token(refresh_token_str)
+            user = None
 
-        # 2. Check the token exists in the DB and is not revoked
-        stored = self._token_repo.get_by_token(refresh_token_str)
         if stored is None or stored.revoked:
             logger.warning("Refresh token revoked or missing")
-            raise invalid_exc
+            raise _invalid_refresh_token()
 
         # 3. Check DB-level expiry (belt-and-suspenders)
-        if stored.expires_at < datetime.now(tz=timezone.utc):
+        if stored.expires_at_epoch < time.time():
             logger.warning("Refresh token expired in database")
-            raise invalid_exc
+            raise _invalid_refresh_token()
 
-        # 4. Fetch the user
-        user_id = int(payload["sub"])
-        user = self._user_repo.get_by_id(user_id)
+        # 4. Fetch the user when the JOIN did not already supply it; the
+        #    stored row already carries the integer user id
+        if user is None:
+            user = self._user_repo.get_by_id(stored.user_id)
         if user is None or not user.is_active:
             logger.warning("Refresh token user not found or inactive")
-            raise invalid_exc
+            raise _invalid_refresh_token()
 
         logger.info("Refresh token validated for user id=%s", user.id)
         access_token = create_access_token(user.id, user.role.value)
-        return AccessToken(access_token=access_token)
+        return AccessToken.model_construct(access_token=access_token)
 
     # ------------------------------------------------------------------
     # Logout
@@ -127,15 +155,16 @@ class AuthService:
     def _issue_token_pair(self, user: User) -> Token:
         """Create and persist an access/refresh token pair for a user."""
         access_token = create_access_token(user.id, user.role.value)
-        refresh_token_str = create_refresh_token(user.id, user.role.value)
+        jti = uuid.uuid4().hex
+        refresh_token_str = create_refresh_token(user.id, user.role.value, jti=jti)
 
         expires_at = datetime.now(tz=timezone.utc) + timedelta(
             days=settings.REFRESH_TOKEN_EXPIRE_DAYS
         )
-        self._token_repo.create(user.id, refresh_token_str, expires_at)
+        self._token_repo.create(user.id, refresh_token_str, expires_at, jti=jti)
         logger.info("Issued token pair for user id=%s", user.id)
 
-        return Token(
+        return Token.model_construct(
             access_token=access_token,
             refresh_token=refresh_token_str,
         )
@@ -3,23 +3,47 @@ Cart management service.
 Store employees can create carts, add/update items, clear carts, and view totals.
 """
 import sqlite3
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal
 import logging
+from types import MappingProxyType
+from typing import NoReturn
 
 from fastapi import HTTPException, status
 
+from backend.db.database import begin_immediate
 from backend.models.cart import Cart, CartStatus
 from backend.models.cart_item import CartItem
-from backend.models.item import Item
-from backend.models.stock import StockEntry
 from backend.models.user import User
 from backend.repositories.cart_repository import CartRepository
-from backend.repositories.item_repository import ItemRepository
 from backend.repositories.stock_repository import StockRepository
-from backend.schemas.cart import CartItemCreate, CartItemReturn, CartItemUpdate, CartUpdate, CartStatus
+from backend.schemas.cart import (
+    CartItemTotals,
+    CartItemCreate,
+    CartItemReturn,
+    CartItemUpdate,
+    CartUpdate,
+    CartStatus,
+)
+from backend.utils.cache import TTLCache
+from backend.utils.money import from_cents
 
 logger = logging.getLogger(__name__)
 
+# Computed (items, totals) keyed by (cart_id, version). Cart item writes (via
+# the cart_items triggers and touch()) and item pricing edits bump the cart
+# version, so stale keys are simply never read again. Entries are shared
+# across requests, so they are stored as a tuple and a read-only mapping and
+# callers get fresh list/dict copies.
+_TOTALS_CACHE = TTLCache(maxsize=1024, ttl=300)
+
+_ZERO = Decimal("0.00")
+_EMPTY_TOTALS = MappingProxyType({
+    "subtotal": _ZERO,
+    "discount_total": _ZERO,
+    "tax_total": _ZERO,
+    "total": _ZERO,
+})
+
 
 class CartService:
     """Business logic for cart creation, updates, and totals."""
@@ -29,7 +53,6 @@ class CartService:
         logger.trace("Initializing CartService")
         self._conn = conn
         self._cart_repo = CartRepository(conn)
-        self._item_repo = ItemRepository(conn)
         self._stock_repo = StockRepository(conn)
 
     # ------------------------------------------------------------------
@@ -64,34 +87,25 @@ class CartService:
                 detail=f"Cart is not editable (status={cart.status.value}). Only draft carts can be modified.",
             )
 
-    def update_cart_status(self, cart_id: int, status: CartStatus, updated_by: User) -> Cart:
+    def update_cart_status(self, cart_id: int, new_status: CartStatus, updated_by: User) -> Cart:
         """Update the status of a cart."""
-        logger.info("Updating cart id=%s status to %s", cart_id, status.value)
-        cart = self.get_cart(cart_id)
-        
-        # Validate status transitions
-        if cart.status == CartStatus.COMPLETED and status != CartStatus.COMPLETED:
-            logger.warning("Cannot change status of completed cart id=%s", cart_id)
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Cannot change status of a completed cart",
+        logger.info("Updating cart id=%s status to %s", cart_id, new_status.value)
+        # Draft carts may move anywhere; completed/deleted carts only to
+        # themselves. The guard lives in the UPDATE's WHERE clause.
+        updated = self._cart_repo.update_status_if(
+            cart_id, (CartStatus.DRAFT, new_status), new_status, updated_by.id
+        )
+        if updated is None:
+            # Re-read only on failure to tell a missing cart from a bad transition
+            cart = self.get_cart(cart_id)
+            logger.warning(
+                "Cannot change status of %s cart id=%s", cart.status.value, cart_id
             )
-        
-        if cart.status == CartStatus.DELETED and status != CartStatus.DELETED:
-            logger.warning("Cannot change status of deleted cart id=%s", cart_id)
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
-                detail="Cannot change status of a deleted cart",
-            )
-        
-        updated = self._cart_repo.update_status(cart.id, status, updated_by.id)
-        if not updated:
-            logger.warning("Cart id=%s not found for status update", cart_id)
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Cart with id={cart_id} not found",
+                detail=f"Cannot change status of a {cart.status.value} cart",
             )
-        logger.info("Cart id=%s status updated to %s", cart_id, status.value)
+        logger.info("Cart id=%s status updated to %s", cart_id, new_status.value)
         return updated
 
     def complete_cart(self, cart_id: int, updated_by: User) -> Cart:
@@ -114,34 +128,53 @@ class CartService:
     def add_item(self, cart_id: int, data: CartItemCreate, user: User) -> CartItem:
         """Add an item to a cart and ensure it is unique."""
         logger.info("Adding item id=%s to cart id=%s", data.item_id, cart_id)
-        cart = self.get_cart(cart_id)
+        begin_immediate(self._conn)
+        context = self._cart_repo.get_add_item_context(cart_id, data.item_id)
+        if context is None:
+            logger.warning("Cart id=%s not found", cart_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Cart with id={cart_id} not found",
+            )
+        cart, item_id, stock_quantity, existing_id = context
         self._ensure_cart_editable(cart)
-        item = self._get_item(data.item_id)
-        stock = self._get_stock(item.id)
 
-        existing = self._cart_repo.get_cart_item_by_cart_and_item(cart.id, item.id)
-        if existing:
-            logger.warning("Item id=%s already in cart id=%s", item.id, cart.id)
+        if item_id is None:
+            logger.warning("Item id=%s not found for cart", data.item_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Item with id={data.item_id} not found",
+            )
+        if stock_quantity is None:
+            self._raise_not_in_stock(item_id)
+
+        if existing_id is not None:
+            logger.warning("Item id=%s already in cart id=%s", item_id, cart.id)
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=(
-                    f"Item id={item.id} already exists in cart. "
-                    f"Use PATCH /carts/{cart.id}/items/{existing.id} to update quantity."
+                    f"Item id={item_id} already exists in cart. "
+                    f"Use PATCH /carts/{cart.id}/items/{existing_id} to update quantity."
                 ),
             )
 
-        self._ensure_stock_available(stock, data.quantity)
+        if not self._stock_repo.try_reserve(item_id, data.quantity, user.id):
+            self._raise_insufficient_stock(stock_quantity, data.quantity)
 
         created = self._cart_repo.create_cart_item(
             cart_id=cart.id,
-            item_id=item.id,
-            quantity=float(data.quantity),
+            item_id=item_id,
+            quantity=data.quantity,
             created_by=user.id,
         )
-        # Decrement stock
-        self._stock_repo.adjust_quantity(item.id, -float(data.quantity), user.id)
+        if created is None:
+            # The unique (cart_id, item_id) insert is the final guard
+            logger.warning("Item id=%s already in cart id=%s", item_id, cart.id)
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Item id={item_id} already exists in cart.",
+            )
 
-        self._cart_repo.touch(cart.id, user.id)
         logger.info("Cart item added id=%s", created.id)
         return created
 
@@ -150,13 +183,14 @@ class CartService:
     ) -> CartItem | None:
         """Update a cart item's quantity or delete when quantity is zero."""
         logger.info("Updating cart item id=%s in cart id=%s", cart_item_id, cart_id)
+        begin_immediate(self._conn)
         cart = self.get_cart(cart_id)
         self._ensure_cart_editable(cart)
         cart_item = self._get_cart_item(cart.id, cart_item_id)
 
         if data.quantity == 0:
             # Increment stock back
-            self._stock_repo.adjust_quantity(cart_item.item_id, float(cart_item.quantity), user.id)
+            self._stock_repo.adjust_quantity(cart_item.item_id, cart_item.quantity, user.id)
             self._cart_repo.delete_cart_item(cart_item.id)
             self._cart_repo.touch(cart.id, user.id)
             logger.info("Cart item removed id=%s", cart_item.id)
@@ -164,29 +198,38 @@ class CartService:
 
         # Calculate delta
         delta = data.quantity - cart_item.quantity
+        if delta == 0:
+            # Idempotent retry: nothing to reserve, release or rewrite
+            logger.info("Cart item id=%s quantity unchanged", cart_item.id)
+            return cart_item
         if delta > 0:
-            stock = self._get_stock(cart_item.item_id)
-            self._ensure_stock_available(stock, delta)
+            if not self._stock_repo.try_reserve(cart_item.item_id, delta, user.id):
+                stock = self._stock_repo.get_by_item_id(cart_item.item_id)
+                if not stock:
+                    self._raise_not_in_stock(cart_item.item_id)
+                self._raise_insufficient_stock(stock.quantity, delta)
+        elif delta < 0:
+            self._stock_repo.adjust_quantity(cart_item.item_id, -delta, user.id)
 
         updated = self._cart_repo.update_cart_item_quantity(
             cart_item.id, data.quantity, updated_by=user.id
         )
-        # Adjust stock
-        self._stock_repo.adjust_quantity(cart_item.item_id, -float(delta), user.id)
 
-        self._cart_repo.touch(cart.id, user.id)
         logger.info("Cart item updated id=%s", cart_item.id)
         return updated  # type: ignore[return-value]
 
     def clear_cart(self, cart_id: int, user: User) -> int:
         """Remove all cart items for the given cart and increment stock."""
         logger.info("Clearing cart id=%s", cart_id)
+        begin_immediate(self._conn)
         cart = self.get_cart(cart_id)
         self._ensure_cart_editable(cart)
         cart_items = self._cart_repo.list_cart_items_by_cart(cart.id)
-        
-        for ci in cart_items:
-            self._stock_repo.adjust_quantity(ci.item_id, float(ci.quantity), user.id)
+        if cart_items:
+            # Put every line's quantity back on the shelf in one statement
+            self._stock_repo.adjust_quantities(
+                [(ci.item_id, ci.quantity) for ci in cart_items], user.id
+            )
 
         cleared = self._cart_repo.clear_cart_items(cart.id)
         self._cart_repo.touch(cart.id, user.id)
@@ -210,24 +253,20 @@ class CartService:
             data.quantity,
         )
         
-        # Validate cart exists first
-        cart = self.get_cart(cart_id)
-        self._ensure_cart_editable(cart)
-        
-        # Validate cart item exists and belongs to the cart
-        cart_item = self._cart_repo.get_cart_item_by_id(cart_item_id)
-        if not cart_item:
-            logger.warning("Cart item id=%s not found", cart_item_id)
+        begin_immediate(self._conn)
+        context = self._cart_repo.get_cart_with_item(cart_id, cart_item_id)
+        if context is None:
+            logger.warning("Cart id=%s not found", cart_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Cart item with id={cart_item_id} not found",
+                detail=f"Cart with id={cart_id} not found",
             )
-        
-        if cart_item.cart_id != cart_id:
+        cart, cart_item = context
+        self._ensure_cart_editable(cart)
+
+        if cart_item is None:
             logger.warning(
-                "Cart item id=%s does not belong to cart id=%s",
-                cart_item_id,
-                cart_id,
+                "Cart item id=%s not found in cart id=%s", cart_item_id, cart_id
             )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -238,7 +277,7 @@ class CartService:
         return_quantity = data.quantity if data.quantity is not None else cart_item.quantity
         
         # Validate return quantity
-        if return_quantity <= Decimal("0"):
+        if return_quantity <= _ZERO:
             logger.warning("Invalid return quantity: %s", return_quantity)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -258,13 +297,13 @@ class CartService:
         
         # Increment stock
         self._stock_repo.adjust_quantity(
-            cart_item.item_id, float(return_quantity), user.id
+            cart_item.item_id, return_quantity, user.id
         )
         
         # Calculate new quantity
         new_quantity = cart_item.quantity - return_quantity
         
-        if new_quantity == Decimal("0"):
+        if new_quantity == _ZERO:
             # Full return - delete the cart item
             self._cart_repo.delete_cart_item(cart_item.id)
             self._cart_repo.touch(cart.id, user.id)
@@ -275,7 +314,6 @@ class CartService:
             updated = self._cart_repo.update_cart_item_quantity(
                 cart_item.id, new_quantity, updated_by=user.id
             )
-            self._cart_repo.touch(cart.id, user.id)
             logger.info(
                 "Cart item partially returned id=%s, new quantity=%s",
                 cart_item.id,
@@ -297,114 +335,95 @@ class CartService:
         """Calculate pricing totals and line items for a cart."""
         logger.info("Calculating totals for cart id=%s", cart_id)
         cart = self.get_cart(cart_id)
-        cart_items = self._cart_repo.list_cart_items_by_cart(cart.id)
-        if not cart_items:
-            logger.info("Cart id=%s has no items", cart.id)
-            return {
-                "cart": cart,
-                "items": [],
-                "totals": self._empty_totals(),
-            }
-
-        item_map = {item.id: item for item in self._list_items(cart_items)}
-        line_items = []
-        subtotal = Decimal("0")
-        discount_total = Decimal("0")
-        tax_total = Decimal("0")
-
-        for cart_item in cart_items:
-            item = item_map.get(cart_item.item_id)
-            if not item:
-                logger.warning("Missing item id=%s for cart totals", cart_item.item_id)
-                continue
-
-            line = self._calculate_line(item, cart_item.quantity)
-            line_items.append({
-                "id": cart_item.id,
-                "item_id": item.id,
-                "name": item.name,
-                "sku": item.sku,
-                "unit_price": item.unit_price,
-                "quantity": cart_item.quantity,
-                "discount_rate": item.discount_rate,
-                "tax_rate": item.tax_rate,
-                "line_subtotal": line["line_subtotal"],
-                "line_discount": line["line_discount"],
-                "line_tax": line["line_tax"],
-                "line_total": line["line_total"],
-            })
-            subtotal += line["line_subtotal"]
-            discount_total += line["line_discount"]
-            tax_total += line["line_tax"]
-
-        total = subtotal - discount_total + tax_total
-        totals = {
-            "subtotal": self._money(subtotal),
-            "discount_total": self._money(discount_total),
-            "tax_total": self._money(tax_total),
-            "total": self._money(total),
-        }
+        key = (cart.id, cart.version)
+        cached = _TOTALS_CACHE.get(key)
+        if cached is None:
+            cached = self._compute_totals(cart.id)
+            _TOTALS_CACHE.set(key, cached)
+        items, totals = cached
         logger.info("Totals calculated for cart id=%s", cart.id)
         return {
             "cart": cart,
-            "items": line_items,
-            "totals": totals,
+            "items": list(items),
+            "totals": dict(totals),
+        }
+
+    def calculate_totals_only(self, cart_id: int) -> dict:
+        """Return just the pricing totals for a cart, summed in SQL."""
+        logger.info("Calculating totals only for cart id=%s", cart_id)
+        cart = self.get_cart(cart_id)
+        cached = _TOTALS_CACHE.get((cart.id, cart.version))
+        if cached is not None:
+            return dict(cached[1])
+        subtotal, discount_total, tax_total = self._cart_repo.sum_cart_totals(cart.id)
+        return {
+            "subtotal": from_cents(subtotal),
+            "discount_total": from_cents(discount_total),
+            "tax_total": from_cents(tax_total),
+            "total": from_cents(subtotal - discount_total + tax_total),
         }
 
+    def _compute_totals(
+        self, cart_id: int
+    ) -> tuple[tuple[CartItemTotals, ...], MappingProxyType]:
+        """Return the priced line items and totals for a cart's current contents."""
+        # One pass over the cursor: price each line as it is read and keep
+        # only the finished response lines. All sums are integer cents;
+        # Decimals are only built for the output.
+        line_items: list[CartItemTotals] = []
+        subtotal = discount_total = tax_total = 0
+        for line in self._cart_repo.iter_cart_lines(cart_id):
+            line_item, line_subtotal, line_discount, line_tax = self._calculate_line(line)
+            subtotal += line_subtotal
+            discount_total += line_discount
+            tax_total += line_tax
+            line_items.append(line_item)
+
+        if not line_items:
+            logger.info("Cart id=%s has no items", cart_id)
+            return (), _EMPTY_TOTALS
+
+        totals = MappingProxyType({
+            "subtotal": from_cents(subtotal),
+            "discount_total": from_cents(discount_total),
+            "tax_total": from_cents(tax_total),
+            "total": from_cents(subtotal - discount_total + tax_total),
+        })
+        return tuple(line_items), totals
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _get_item(self, item_id: int) -> Item:
-        """Fetch an item or raise if it is missing."""
-        logger.trace("Fetching item id=%s for cart", item_id)
-        item = self._item_repo.get_by_id(item_id)
-        if not item:
-            logger.warning("Item id=%s not found for cart", item_id)
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Item with id={item_id} not found",
-            )
-        return item
-
-    def _get_stock(self, item_id: int) -> StockEntry:
-        """Fetch stock for an item or raise if unavailable."""
-        logger.trace("Fetching stock for item id=%s", item_id)
-        stock = self._stock_repo.get_by_item_id(item_id)
-        if not stock:
-            logger.warning("Item id=%s not in stock", item_id)
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=(
-                    f"Item id={item_id} is not in stock. "
-                    "Add it to stock before adding to a cart."
-                ),
-            )
-        return stock
+    def _raise_not_in_stock(self, item_id: int) -> NoReturn:
+        """Raise an HTTP conflict for an item that has no stock entry."""
+        logger.warning("Item id=%s not in stock", item_id)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                f"Item id={item_id} is not in stock. "
+                "Add it to stock before adding to a cart."
+            ),
+        )
 
-    def _ensure_stock_available(self, stock: StockEntry, desired_quantity: Decimal) -> None:
-        """Raise an HTTP conflict if the desired quantity exceeds stock."""
-        if desired_quantity > stock.quantity:
-            logger.warning(
-                "Requested quantity exceeds available stock (%s > %s)",
-                desired_quantity,
-                stock.quantity,
-            )
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=(
-                    "Requested quantity exceeds available stock "
-                    f"({desired_quantity} > {stock.quantity})."
-                ),
-            )
+    def _raise_insufficient_stock(self, available: Decimal, desired_quantity: Decimal) -> NoReturn:
+        """Raise an HTTP conflict for a quantity that exceeds stock."""
+        logger.warning(
+            "Requested quantity exceeds available stock (%s > %s)",
+            desired_quantity,
+            available,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                "Requested quantity exceeds available stock "
+                f"({desired_quantity} > {available})."
+            ),
+        )
 
     def _get_cart_item(self, cart_id: int, cart_item_id: int) -> CartItem:
         """Return a cart item ensuring it belongs to the given cart."""
-        cart_item = self._cart_repo.get_cart_item_by_id(cart_item_id)
-        if cart_item and cart_item.cart_id == cart_id:
-            return cart_item
-
-        cart_item = self._cart_repo.get_cart_item_by_cart_and_item(cart_id, cart_item_id)
+        cart_item = self._cart_repo.get_cart_item_in_cart(cart_id, cart_item_id)
         if not cart_item:
             logger.warning("Cart item id=%s not found in cart id=%s", cart_item_id, cart_id)
             raise HTTPException(
@@ -413,78 +432,52 @@ class CartService:
             )
         return cart_item
 
-    def _list_items(self, cart_items: list[CartItem]) -> list[Item]:
-        """Return item rows matching the provided cart items."""
-        item_ids = tuple({cart_item.item_id for cart_item in cart_items})
-        if not item_ids:
-            logger.trace("No item ids provided for cart list")
-            return []
-        placeholders = ", ".join("?" for _ in item_ids)
-        rows = self._conn.execute(
-            f"SELECT * FROM items WHERE id IN ({placeholders})",
-            item_ids,
-        ).fetchall()
-        return [Item.from_row(row) for row in rows]
-
-    def _calculate_line(self, item: Item, quantity: Decimal) -> dict:
-        """Return line totals for a cart item including discounts and tax."""
-        logger.trace("Calculating cart line for item id=%s", item.id)
-        unit_price = item.unit_price
-        line_subtotal = self._money(unit_price * quantity)
-        discount = self._money(line_subtotal * (item.discount_rate / Decimal("100")))
-        taxable = line_subtotal - discount
-        tax = self._money(taxable * (item.tax_rate / Decimal("100")))
-        line_total = self._money(taxable + tax)
-        return {
-            "line_subtotal": line_subtotal,
-            "line_discount": discount,
-            "line_tax": tax,
-            "line_total": line_total,
-        }
-
-    def _money(self, value: Decimal) -> Decimal:
-        """Quantize currency values to two decimal places."""
-        logger.trace("Quantizing cart monetary value")
-        return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    def _calculate_line(self, line: dict) -> tuple[CartItemTotals, int, int, int]:
+        """
+        Build the priced response line for a repository cart line.
 
-    def _empty_totals(self) -> dict:
-        """Return a totals payload with zeroed values."""
-        logger.trace("Returning empty cart totals")
-        zero = Decimal("0.00")
-        return {
-            "subtotal": zero,
-            "discount_total": zero,
-            "tax_total": zero,
-            "total": zero,
-        }
+        The integer-cent amounts are computed by the repository query; this
+        only turns them into Decimals. Returns the line along with its
+        (subtotal, discount, tax) in cents.
+        """
+        line_subtotal = line["line_subtotal_cents"]
+        discount = line["line_discount_cents"]
+        tax = line["line_tax_cents"]
+        line_item = CartItemTotals.from_line(
+            line,
+            line_subtotal=from_cents(line_subtotal),
+            line_discount=from_cents(discount),
+            line_tax=from_cents(tax),
+            line_total=from_cents(line_subtotal - discount + tax),
+        )
+        return line_item, line_subtotal, discount, tax
 
     def update_cart(self, cart_id: int, data: CartUpdate, updated_by: User) -> Cart:
         """Update cart metadata such as the desk number."""
         logger.info("Updating cart id=%s", cart_id)
-        cart = self.get_cart(cart_id)
-        self._ensure_cart_editable(cart)
-
-        # Check for duplicate desk_number if one is being assigned
-        if data.desk_number is not None:
-            existing = self._cart_repo.get_by_desk_number(data.desk_number)
-            if existing and existing.id != cart.id:
-                logger.warning("Desk number %s already assigned to cart id=%s", data.desk_number, existing.id)
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"Desk number '{data.desk_number}' is already assigned to another cart",
-                )
-
-        updated = self._cart_repo.update_desk_number(cart.id, data.desk_number, updated_by.id)
-        if not updated:
-            logger.warning("Cart id=%s not found for update", cart_id)
+        begin_immediate(self._conn)
+
+        # The status guard lives in the UPDATE's WHERE clause, so a missing or
+        # non-draft cart matches no row and never reaches the desk_number
+        # UNIQUE constraint; a constraint failure therefore always means an
+        # editable cart asked for a desk that is already taken.
+        try:
+            updated = self._cart_repo.update_desk_number_if(
+                cart_id, data.desk_number, (CartStatus.DRAFT,), updated_by.id
+            )
+        except sqlite3.IntegrityError:
+            logger.warning("Desk number %s already assigned to another cart", data.desk_number)
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Cart with id={cart_id} not found",
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Desk number '{data.desk_number}' is already assigned to another cart",
             )
+        if updated is None:
+            # Raises 404 for a missing cart, 409 for a non-draft one
+            self._ensure_cart_editable(self.get_cart(cart_id))
         logger.info("Cart id=%s updated", cart_id)
-        return updated
+        return updated  # type: ignore[return-value]
 
-    def list_carts_with_desk_number(self) -> list[Cart]:
-        """Return carts that have a desk number assigned."""
+    def list_carts_with_desk_number(self) -> list[tuple[Cart, int, Decimal]]:
+        """Return carts that have a desk number, with their item count and total."""
         logger.info("Listing carts with desk_number")
         return self._cart_repo.list_with_desk_number()
@@ -11,9 +11,16 @@ from backend.models.category import Category
 from backend.models.user import User
 from backend.repositories.category_repository import CategoryRepository
 from backend.schemas.category import CategoryCreate, CategoryUpdate
+from backend.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# The full category list is read on every menu/catalog screen and changes
+# rarely. Entries are tagged with the table's list version and only served
+# while it still matches, so a write is visible as soon as it commits, in
+# every worker process.
+_CATEGORIES_CACHE = TTLCache(maxsize=1, ttl=60)
+
 
 class CategoryService:
     """Business logic for category operations."""
@@ -42,29 +49,35 @@ class CategoryService:
     def list_categories(self) -> list[Category]:
         """Return all categories ordered by sort order and name."""
         logger.info("Listing categories")
-        return self._repo.list_all()
+        # Read the version before the list: if a write commits in between,
+        # the entry is tagged older than its contents and is simply refetched
+        version = self._repo.get_list_version()
+        cached = _CATEGORIES_CACHE.get("all")
+        if cached is not None and cached[0] == version:
+            return list(cached[1])
+        categories = tuple(self._repo.list_all())
+        _CATEGORIES_CACHE.set("all", (version, categories))
+        return list(categories)
 
     # ------------------------------------------------------------------
     # Create
     # ------------------------------------------------------------------
 
     def create_category(self, data: CategoryCreate, created_by: User) -> Category:
-        """Create a new category after verifying uniqueness."""
-        # Check for duplicate name
+        """Create a new category, relying on the UNIQUE name constraint."""
         logger.info("Creating category %s", data.name)
-        existing = self._repo.get_by_name(data.name)
-        if existing:
+        try:
+            category = self._repo.create(
+                name=data.name,
+                description=data.description,
+                created_by=created_by.id,
+            )
+        except sqlite3.IntegrityError:
             logger.warning("Duplicate category name: %s", data.name)
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Category with name '{data.name}' already exists",
             )
-
-        category = self._repo.create(
-            name=data.name,
-            description=data.description,
-            created_by=created_by.id,
-        )
         logger.info("Category created id=%s", category.id)
         return category
 
@@ -75,27 +88,28 @@ class CategoryService:
     def update_category(
         self, category_id: int, data: CategoryUpdate, updated_by: User
     ) -> Category:
-        """Update a category after enforcing naming rules."""
+        """Update a category, relying on the UNIQUE name constraint."""
         logger.info("Updating category id=%s", category_id)
-        category = self.get_category(category_id)
-
-        # Check for name conflict if renaming
-        if data.name is not None and data.name != category.name:
-            existing = self._repo.get_by_name(data.name)
-            if existing:
-                logger.warning("Duplicate category rename attempt: %s", data.name)
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"Category with name '{data.name}' already exists",
-                )
-
-        updated_category = self._repo.update(
-            category_id=category_id,
-            name=data.name,
-            description=data.description,
-            sort_order=data.sort_order,
-            updated_by=updated_by.id,
-        )  # type: ignore[return-value]
+        try:
+            updated_category = self._repo.update(
+                category_id=category_id,
+                name=data.name,
+                description=data.description,
+                sort_order=data.sort_order,
+                updated_by=updated_by.id,
+            )
+        except sqlite3.IntegrityError:
+            logger.warning("Duplicate category rename attempt: %s", data.name)
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Category with name '{data.name}' already exists",
+            )
+        if updated_category is None:
+            logger.warning("Category id=%s not found", category_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Category with id={category_id} not found",
+            )
         logger.info("Category updated id=%s", category_id)
         return updated_category
 
@@ -2,23 +2,31 @@
 Daily account management service.
 Handles closing daily accounts and retrieving summaries.
 """
+import json
 import sqlite3
-from datetime import date, datetime, timezone
-from decimal import Decimal, ROUND_HALF_UP
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
 import logging
 from io import BytesIO
 from typing import Optional
 
 from fastapi import HTTPException, status
 
-from backend.models.cart import Cart
+from backend.db.database import begin_immediate
 from backend.models.daily_account import DailyAccount
 from backend.models.user import User
 from backend.repositories.cart_repository import CartRepository
 from backend.repositories.daily_account_repository import DailyAccountRepository
 from backend.repositories.item_repository import ItemRepository
 from backend.repositories.category_repository import CategoryRepository
+from backend.schemas.daily_account import (
+    DailyAccountItemResponse,
+    DailyAccountResponse,
+    DailyAccountSummaryResponse,
+    DailyAccountTotals,
+)
 from backend.services.pdf_service import PDFService
+from backend.utils.money import from_cents
 
 logger = logging.getLogger(__name__)
 
@@ -62,22 +70,23 @@ class DailyAccountService:
             )
         return account
 
-    def get_summary(self, account_id: int) -> dict:
+    def get_summary(self, account_id: int) -> DailyAccountSummaryResponse:
         """Return a daily account summary with items and totals."""
         logger.info("Building daily account summary id=%s", account_id)
         account = self.get_account(account_id)
         items = self._account_repo.list_items_by_account(account.id)
-        totals = {
-            "subtotal": account.subtotal,
-            "discount_total": account.discount_total,
-            "tax_total": account.tax_total,
-            "total": account.total,
-        }
-        return {
-            "account": account,
-            "items": items,
-            "totals": totals,
-        }
+        # Domain models are already typed, so assemble the nested response
+        # directly instead of validating it again
+        return DailyAccountSummaryResponse.model_construct(
+            account=DailyAccountResponse.from_model(account),
+            items=[DailyAccountItemResponse.from_model(item) for item in items],
+            totals=DailyAccountTotals.model_construct(
+                subtotal=account.subtotal,
+                discount_total=account.discount_total,
+                tax_total=account.tax_total,
+                total=account.total,
+            ),
+        )
 
     def list_accounts(self, limit: int = 30) -> list[DailyAccount]:
         """Return recent daily accounts limited by the provided count."""
@@ -99,6 +108,7 @@ class DailyAccountService:
         """Close today's account and persist aggregated totals."""
         logger.info("Closing daily account for today user_id=%s", user.id)
         today = date.today()
+        begin_immediate(self._conn)
         existing = self._account_repo.get_by_date(today)
 
         if existing and existing.is_closed:
@@ -108,9 +118,9 @@ class DailyAccountService:
                 detail=f"Account for {today} is already closed.",
             )
 
-        # Get today's carts
-        carts = self._get_todays_carts()
-        if not carts:
+        # Get today's carts, bounded by the same date the account is keyed on
+        cart_ids = self._get_cart_ids_by_date(today)
+        if not cart_ids:
             logger.warning("No carts found for daily close date=%s", today)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -118,22 +128,22 @@ class DailyAccountService:
             )
 
         # Aggregate all cart items
-        aggregated_items = self._aggregate_cart_items(carts)
+        aggregated_items = self._aggregate_cart_items(cart_ids)
 
         # Calculate totals
         totals = self._calculate_totals(aggregated_items)
 
-        # Create or update the account
+        # Create or update the account, closing it in the same statement
         if existing:
-            account = self._account_repo.update_totals(
+            account = self._account_repo.update_totals_and_close(
                 account_id=existing.id,
                 subtotal=float(totals["subtotal"]),
                 discount_total=float(totals["discount_total"]),
                 tax_total=float(totals["tax_total"]),
                 total=float(totals["total"]),
-                carts_count=len(carts),
+                carts_count=len(cart_ids),
                 items_count=len(aggregated_items),
-                updated_by=user.id,
+                closed_by=user.id,
             )
             # Clear old items and re-create
             self._account_repo.delete_items_by_account(existing.id)
@@ -144,32 +154,16 @@ class DailyAccountService:
                 discount_total=float(totals["discount_total"]),
                 tax_total=float(totals["tax_total"]),
                 total=float(totals["total"]),
-                carts_count=len(carts),
+                carts_count=len(cart_ids),
                 items_count=len(aggregated_items),
                 created_by=user.id,
+                closed=True,
             )
 
         # Store aggregated items
-        for item_data in aggregated_items:
-            self._account_repo.create_item(
-                account_id=account.id,
-                item_id=item_data["item_id"],
-                item_name=item_data["name"],
-                sku=item_data["sku"],
-                quantity=float(item_data["quantity"]),
-                unit_price=float(item_data["unit_price"]),
-                discount_rate=float(item_data["discount_rate"]),
-                tax_rate=float(item_data["tax_rate"]),
-                line_subtotal=float(item_data["line_subtotal"]),
-                line_discount=float(item_data["line_discount"]),
-                line_tax=float(item_data["line_tax"]),
-                line_total=float(item_data["line_total"]),
-            )
-
-        # Close the account
-        closed_account = self._account_repo.close_account(account.id, closed_by=user.id)
+        self._account_repo.create_items(account.id, aggregated_items)
         logger.info("Daily account closed id=%s", account.id)
-        return closed_account  # type: ignore[return-value]
+        return account  # type: ignore[return-value]
 
     def open_account(self, account_id: int, user: User) -> DailyAccount:
         """Reopen a closed daily account."""
@@ -190,6 +184,7 @@ class DailyAccountService:
     def close_by_date(self, account_date: date, user: User) -> DailyAccount:
         """Close a specific date's daily account."""
         logger.info("Closing daily account date=%s", account_date)
+        begin_immediate(self._conn)
         existing = self._account_repo.get_by_date(account_date)
 
         if existing and existing.is_closed:
@@ -200,8 +195,8 @@ class DailyAccountService:
             )
 
         # Get carts for the specific date
-        carts = self._get_carts_by_date(account_date)
-        if not carts:
+        cart_ids = self._get_cart_ids_by_date(account_date)
+        if not cart_ids:
             logger.warning("No carts found for date=%s", account_date)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -209,22 +204,22 @@ class DailyAccountService:
             )
 
         # Aggregate all cart items
-        aggregated_items = self._aggregate_cart_items(carts)
+        aggregated_items = self._aggregate_cart_items(cart_ids)
 
         # Calculate totals
         totals = self._calculate_totals(aggregated_items)
 
-        # Create or update the account
+        # Create or update the account, closing it in the same statement
         if existing:
-            account = self._account_repo.update_totals(
+            account = self._account_repo.update_totals_and_close(
                 account_id=existing.id,
                 subtotal=float(totals["subtotal"]),
                 discount_total=float(totals["discount_total"]),
                 tax_total=float(totals["tax_total"]),
                 total=float(totals["total"]),
-                carts_count=len(carts),
+                carts_count=len(cart_ids),
                 items_count=len(aggregated_items),
-                updated_by=user.id,
+                closed_by=user.id,
             )
             self._account_repo.delete_items_by_account(existing.id)
         else:
@@ -234,31 +229,16 @@ class DailyAccountService:
                 discount_total=float(totals["discount_total"]),
                 tax_total=float(totals["tax_total"]),
                 total=float(totals["total"]),
-                carts_count=len(carts),
+                carts_count=len(cart_ids),
                 items_count=len(aggregated_items),
                 created_by=user.id,
+                closed=True,
             )
 
         # Store aggregated items
-        for item_data in aggregated_items:
-            self._account_repo.create_item(
-                account_id=account.id,
-                item_id=item_data["item_id"],
-                item_name=item_data["name"],
-                sku=item_data["sku"],
-                quantity=float(item_data["quantity"]),
-                unit_price=float(item_data["unit_price"]),
-                discount_rate=float(item_data["discount_rate"]),
-                tax_rate=float(item_data["tax_rate"]),
-                line_subtotal=float(item_data["line_subtotal"]),
-                line_discount=float(item_data["line_discount"]),
-                line_tax=float(item_data["line_tax"]),
-                line_total=float(item_data["line_total"]),
-            )
-
-        closed_account = self._account_repo.close_account(account.id, closed_by=user.id)
+        self._account_repo.create_items(account.id, aggregated_items)
         logger.info("Daily account closed id=%s", account.id)
-        return closed_account  # type: ignore[return-value]
+        return account  # type: ignore[return-value]
 
     def open_by_date(self, account_date: date, user: User) -> DailyAccount:
         """Reopen a specific date's daily account."""
@@ -322,137 +302,115 @@ class DailyAccountService:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _get_todays_carts(self) -> list[Cart]:
-        """Return carts created during the current UTC day."""
-        today_start = datetime.now(tz=timezone.utc).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ).isoformat()
-        today_end = datetime.now(tz=timezone.utc).replace(
-            hour=23, minute=59, second=59, microsecond=999999
-        ).isoformat()
+    def _get_cart_ids_by_date(self, target_date: date) -> list[int]:
+        """Return the ids of carts created on a specific date."""
+        # Half-open [start, next day) range served by idx_carts_created_at
+        day_start = datetime.combine(target_date, time.min, tzinfo=timezone.utc)
+        day_end = day_start + timedelta(days=1)
 
-        rows = self._conn.execute(
+        cursor = self._conn.execute(
             """
-            SELECT * FROM carts
-             WHERE created_at >= ? AND created_at <= ?
+            SELECT id FROM carts
+             WHERE created_at >= ? AND created_at < ?
              ORDER BY id
             """,
-            (today_start, today_end),
-        ).fetchall()
-        logger.trace("Found %s carts for today", len(rows))
-        return [Cart.from_row(row) for row in rows]
-
-    def _get_carts_by_date(self, target_date: date) -> list[Cart]:
-        """Get carts created on a specific date."""
-        date_start = datetime.combine(target_date, datetime.min.time()).replace(
-            tzinfo=timezone.utc
-        ).isoformat()
-        date_end = datetime.combine(target_date, datetime.max.time()).replace(
-            tzinfo=timezone.utc
-        ).isoformat()
-
-        rows = self._conn.execute(
-            """
-            SELECT * FROM carts
-             WHERE created_at >= ? AND created_at <= ?
-             ORDER BY id
-            """,
-            (date_start, date_end),
-        ).fetchall()
-        logger.trace("Found %s carts for date=%s", len(rows), target_date)
-        return [Cart.from_row(row) for row in rows]
+            (day_start.isoformat(), day_end.isoformat()),
+        )
+        cart_ids = [row["id"] for row in cursor]
+        logger.trace("Found %s carts for date=%s", len(cart_ids), target_date)
+        return cart_ids
 
-    def _aggregate_cart_items(self, carts: list[Cart]) -> list[dict]:
+    def _aggregate_cart_items(self, cart_ids: list[int]) -> list[dict]:
         """Aggregate items across all carts, summing quantities for same items."""
-        cart_ids = tuple(cart.id for cart in carts)
         if not cart_ids:
             logger.trace("No carts provided for aggregation")
             return []
 
-        placeholders = ", ".join("?" for _ in cart_ids)
+        # Bind the ids as one JSON array so the statement text is the same for
+        # any number of carts and never approaches SQLite's variable limit
+        cart_ids_json = json.dumps(cart_ids)
+        # One row per item: quantities are summed in SQLite as integer
+        # thousandths (the API allows three decimal places) and each line is
+        # priced there in integer cents, rounding half-up at every step the
+        # same way CartRepository prices an open cart
         rows = self._conn.execute(
-            f"""
-            SELECT ci.item_id, ci.quantity, i.name, i.sku, i.unit_price,
-                   i.discount_rate, i.tax_rate
-              FROM cart_items ci
-              JOIN items i ON i.id = ci.item_id
-             WHERE ci.cart_id IN ({placeholders})
+            """
+            WITH lines AS (
+                SELECT ci.item_id,
+                       SUM(CAST(ROUND(ci.quantity * 1000) AS INTEGER)) AS quantity_milli,
+                       i.name, i.sku, i.unit_price, i.discount_rate, i.tax_rate,
+                       CAST(ROUND(i.unit_price * 100) AS INTEGER)    AS unit_price_cents,
+                       CAST(ROUND(i.discount_rate * 100) AS INTEGER) AS discount_bps,
+                       CAST(ROUND(i.tax_rate * 100) AS INTEGER)      AS tax_bps
+                  FROM cart_items ci
+                  JOIN items i ON i.id = ci.item_id
+                 WHERE ci.cart_id IN (SELECT value FROM json_each(?))
+                 GROUP BY ci.item_id
+            ), priced AS (
+                SELECT *, (unit_price_cents * quantity_milli + 500) / 1000 AS subtotal
+                  FROM lines
+            ), discounted AS (
+                SELECT *, (subtotal * discount_bps + 5000) / 10000 AS discount
+                  FROM priced
+            )
+            SELECT item_id, quantity_milli, name, sku,
+                   unit_price, discount_rate, tax_rate,
+                   subtotal, discount,
+                   ((subtotal - discount) * tax_bps + 5000) / 10000 AS tax
+              FROM discounted
+             ORDER BY item_id
             """,
-            cart_ids,
-        ).fetchall()
-
-        # Aggregate by item_id
-        aggregated: dict[int, dict] = {}
-        for row in rows:
-            item_id = row["item_id"]
-            quantity = Decimal(str(row["quantity"]))
-            unit_price = Decimal(str(row["unit_price"]))
-            discount_rate = Decimal(str(row["discount_rate"]))
-            tax_rate = Decimal(str(row["tax_rate"]))
-
-            if item_id not in aggregated:
-                line_subtotal = self._money(unit_price * quantity)
-                line_discount = self._money(line_subtotal * (discount_rate / Decimal("100")))
-                taxable = line_subtotal - line_discount
-                line_tax = self._money(taxable * (tax_rate / Decimal("100")))
-                line_total = self._money(taxable + line_tax)
-
-                aggregated[item_id] = {
+            (cart_ids_json,),
+        )
+
+        aggregated = []
+        # Unpacked positionally in SELECT order to skip per-key Row lookups
+        for (
+            item_id, quantity_milli, name, sku,
+            unit_price, discount_rate, tax_rate,
+            line_subtotal, line_discount, line_tax,
+        ) in rows:
+            aggregated.append(
+                {
                     "item_id": item_id,
-                    "name": row["name"],
-                    "sku": row["sku"],
-                    "quantity": quantity,
+                    "name": name,
+                    "sku": sku,
+                    "quantity": Decimal(quantity_milli).scaleb(-3),
+                    # Copied verbatim into REAL columns, so no Decimal round-trip
                     "unit_price": unit_price,
                     "discount_rate": discount_rate,
                     "tax_rate": tax_rate,
-                    "line_subtotal": line_subtotal,
-                    "line_discount": line_discount,
-                    "line_tax": line_tax,
-                    "line_total": line_total,
+                    "line_subtotal": from_cents(line_subtotal),
+                    "line_discount": from_cents(line_discount),
+                    "line_tax": from_cents(line_tax),
+                    "line_total": from_cents(line_subtotal - line_discount + line_tax),
+                    "line_subtotal_cents": line_subtotal,
+                    "line_discount_cents": line_discount,
+                    "line_tax_cents": line_tax,
                 }
-            else:
-                # Add to existing
-                aggregated[item_id]["quantity"] += quantity
-                # Recalculate line totals
-                q = aggregated[item_id]["quantity"]
-                up = aggregated[item_id]["unit_price"]
-                dr = aggregated[item_id]["discount_rate"]
-                tr = aggregated[item_id]["tax_rate"]
-
-                line_subtotal = self._money(up * q)
-                line_discount = self._money(line_subtotal * (dr / Decimal("100")))
-                taxable = line_subtotal - line_discount
-                line_tax = self._money(taxable * (tr / Decimal("100")))
-                line_total = self._money(taxable + line_tax)
-
-                aggregated[item_id]["line_subtotal"] = line_subtotal
-                aggregated[item_id]["line_discount"] = line_discount
-                aggregated[item_id]["line_tax"] = line_tax
-                aggregated[item_id]["line_total"] = line_total
+            )
 
         logger.trace("Aggregated %s items from carts", len(aggregated))
-        return list(aggregated.values())
+        return aggregated
 
     def _calculate_totals(self, items: list[dict]) -> dict:
         """Calculate aggregated totals for a list of line items."""
         logger.trace("Calculating daily account totals")
-        subtotal = sum(item["line_subtotal"] for item in items)
-        discount_total = sum(item["line_discount"] for item in items)
-        tax_total = sum(item["line_tax"] for item in items)
-        total = subtotal - discount_total + tax_total
+        # One pass over the integer-cent line amounts; Decimals are built
+        # only for the returned totals
+        subtotal = discount_total = tax_total = 0
+        for item in items:
+            subtotal += item["line_subtotal_cents"]
+            discount_total += item["line_discount_cents"]
+            tax_total += item["line_tax_cents"]
 
         return {
-            "subtotal": self._money(subtotal),
-            "discount_total": self._money(discount_total),
-            "tax_total": self._money(tax_total),
-            "total": self._money(total),
+            "subtotal": from_cents(subtotal),
+            "discount_total": from_cents(discount_total),
+            "tax_total": from_cents(tax_total),
+            "total": from_cents(subtotal - discount_total + tax_total),
         }
 
-    def _money(self, value: Decimal) -> Decimal:
-        """Quantize decimal values to two decimal places."""
-        logger.trace("Quantizing decimal value")
-        return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
     # ------------------------------------------------------------------
     # Sales Charts Export
     # ------------------------------------------------------------------
@@ -3,6 +3,7 @@ Item management service.
 Any authenticated user can create, update, and delete items.
 """
 import sqlite3
+from decimal import Decimal
 from typing import Optional
 import logging
 
@@ -10,12 +11,17 @@ from fastapi import HTTPException, status
 
 from backend.models.item import Item
 from backend.models.user import User
+from backend.repositories.cart_repository import CartRepository
 from backend.repositories.item_repository import ItemRepository
 from backend.repositories.category_repository import CategoryRepository
 from backend.schemas.item import ItemCreate, ItemUpdate
 
 logger = logging.getLogger(__name__)
 
+# Item columns copied into cart totals lines; changing any of them must
+# invalidate cached cart totals
+_CART_LINE_FIELDS = frozenset({"name", "sku", "unit_price", "discount_rate", "tax_rate"})
+
 
 class ItemService:
     """Business logic for item operations."""
@@ -25,6 +31,7 @@ class ItemService:
         logger.trace("Initializing ItemService")
         self._repo = ItemRepository(conn)
         self._category_repo = CategoryRepository(conn)
+        self._cart_repo = CartRepository(conn)
 
     # ------------------------------------------------------------------
     # Read
@@ -123,31 +130,19 @@ class ItemService:
                     detail=f"Item with SKU '{data.sku}' already exists",
                 )
 
+        # Walk only the fields the client sent; Decimals are stored as REAL
         update_fields = {}
-        if data.category_id is not None:
-            update_fields["category_id"] = data.category_id
-        if data.name is not None:
-            update_fields["name"] = data.name
-        if data.description is not None:
-            update_fields["description"] = data.description
-        if data.sku is not None:
-            update_fields["sku"] = data.sku
-        if data.barcode is not None:
-            update_fields["barcode"] = data.barcode
-        if data.image_url is not None:
-            update_fields["image_url"] = data.image_url
-        if data.unit_price is not None:
-            update_fields["unit_price"] = float(data.unit_price)
-        if data.unit_type is not None:
-            update_fields["unit_type"] = data.unit_type
-        if data.tax_rate is not None:
-            update_fields["tax_rate"] = float(data.tax_rate)
-        if data.discount_rate is not None:
-            update_fields["discount_rate"] = float(data.discount_rate)
+        for field in data.model_fields_set:
+            value = getattr(data, field)
+            if value is None:
+                continue
+            update_fields[field] = float(value) if isinstance(value, Decimal) else value
 
         update_fields["updated_by"] = updated_by.id
 
         updated_item = self._repo.update(item_id, **update_fields)  # type: ignore[return-value]
+        if not _CART_LINE_FIELDS.isdisjoint(update_fields):
+            self._cart_repo.bump_versions_for_item(item_id)
         logger.info("Item updated id=%s", item_id)
         return updated_item
 
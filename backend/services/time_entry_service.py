@@ -16,11 +16,13 @@ from backend.models.time_entry import TimeEntry, TimeEntryStatus
 from backend.models.user import User, UserRole
 from backend.repositories.time_entry_repository import TimeEntryRepository
 from backend.repositories.user_repository import UserRepository
-from backend.schemas.time_entry import TimeEntryCreate, TimeEntryUpdate, TimeEntryReview, EmployeeTimeEntries, GroupedTimeEntriesResponse
+from backend.schemas.time_entry import TimeEntryCreate, TimeEntryUpdate, TimeEntryReview, GroupedTimeEntriesResponse
 from backend.services.pdf_service import PDFService
 
 logger = logging.getLogger(__name__)
 
+_HUNDREDTH = Decimal("0.01")
+
 
 class TimeEntryService:
     """Business logic for time entry management and reviews."""
@@ -105,8 +107,8 @@ class TimeEntryService:
                 employee_groups[entry.employee_id] = []
             employee_groups[entry.employee_id].append(entry)
         
-        # Build response with employee names
-        employee_time_entries: list[EmployeeTimeEntries] = []
+        # Build the nested payload as plain dicts; it is validated in one call below
+        employee_time_entries: list[dict] = []
         total_hours = Decimal('0')
         total_entries = 0
         
@@ -118,21 +120,24 @@ class TimeEntryService:
             total_hours += emp_total_hours
             total_entries += len(emp_entries)
             
-            employee_time_entries.append(EmployeeTimeEntries(
-                employee_id=employee_id,
-                employee_name=employee_name,
-                entries=emp_entries,
-                total_hours=emp_total_hours,
-                entry_count=len(emp_entries),
-            ))
+            employee_time_entries.append({
+                "employee_id": employee_id,
+                "employee_name": employee_name,
+                "entries": emp_entries,
+                "total_hours": emp_total_hours,
+                "entry_count": len(emp_entries),
+            })
         
         # Sort by employee name
-        employee_time_entries.sort(key=lambda x: x.employee_name)
+        employee_time_entries.sort(key=lambda x: x["employee_name"])
         
-        return GroupedTimeEntriesResponse(
-            employees=employee_time_entries,
-            total_hours=total_hours,
-            total_entries=total_entries,
+        return GroupedTimeEntriesResponse.model_validate(
+            {
+                "employees": employee_time_entries,
+                "total_hours": total_hours,
+                "total_entries": total_entries,
+            },
+            from_attributes=True,
         )
 
     # ------------------------------------------------------------------
@@ -311,7 +316,7 @@ class TimeEntryService:
         end_minutes = end.hour * 60 + end.minute
         
         hours = Decimal(end_minutes - start_minutes) / Decimal(60)
-        return hours.quantize(Decimal("0.01"))
+        return hours.quantize(_HUNDREDTH)
 
     def _detect_overlaps(self, entries: list[dict]) -> set[int]:
         """
@@ -8,6 +8,7 @@ Business rules enforced here:
 """
 import sqlite3
 import logging
+from typing import Optional
 
 from fastapi import HTTPException, status
 
@@ -43,10 +44,24 @@ class UserService:
             )
         return user
 
-    def list_users(self, include_deleted: bool = False) -> list[User]:
-        """Return users, optionally including soft-deleted accounts."""
-        logger.info("Listing users include_deleted=%s", include_deleted)
-        return self._repo.list_all(include_deleted=include_deleted)
+    def list_users(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        include_deleted: bool = False,
+        role: Optional[UserRole] = None,
+    ) -> list[User]:
+        """Return a page of users, optionally including soft-deleted accounts."""
+        logger.info("Listing users include_deleted=%s role=%s", include_deleted, role)
+        return self._repo.list_all(
+            limit=limit, offset=offset, include_deleted=include_deleted, role=role
+        )
+
+    def count_users(
+        self, include_deleted: bool = False, role: Optional[UserRole] = None
+    ) -> int:
+        """Return the total number of users matching the list filters."""
+        return self._repo.count_all(include_deleted=include_deleted, role=role)
 
     # ------------------------------------------------------------------
     # Create
@@ -186,7 +201,7 @@ class UserService:
                 detail="You do not have permission to delete this account",
             )
 
-        if not self._repo.soft_delete(user_id):
+        if not self._repo.soft_delete_and_revoke(user_id):
             logger.warning("User id=%s not found for deletion", user_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
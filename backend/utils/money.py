@@ -0,0 +1,18 @@
+"""
+Fixed-point money helpers shared by the pricing services.
+
+Prices are computed in SQLite as integer cents; these helpers turn the
+results back into Decimals for the API and persisted rows, and turn
+incoming JSON numbers into Decimals without binary float noise.
+"""
+from decimal import Decimal
+
+
+def from_cents(cents: int) -> Decimal:
+    """Return an integer cent amount as a two-place Decimal (330 -> 3.30)."""
+    return Decimal(cents).scaleb(-2)
+
+
+def float_to_decimal(v):
+    """Route floats through str() so 0.1 becomes Decimal('0.1'), not its binary value."""
+    return Decimal(str(v)) if isinstance(v, float) else v
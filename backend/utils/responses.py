@@ -0,0 +1,22 @@
+"""
+Helpers for returning pre-serialized JSON from endpoints.
+
+FastAPI re-validates and re-encodes whatever a route returns against its
+response_model. Routes whose payload is already built from trusted domain
+models can serialize it once through a cached TypeAdapter instead and hand
+the bytes back directly; response_model is still declared on the route so
+the OpenAPI schema stays the same.
+"""
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_response(adapter: TypeAdapter, value: Any, headers: dict[str, str] | None = None) -> Response:
+    """Serialize *value* with *adapter* and wrap the bytes in a JSON Response."""
+    return Response(
+        content=adapter.dump_json(value),
+        media_type="application/json",
+        headers=headers,
+    )